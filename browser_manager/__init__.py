@@ -1,7 +1,10 @@
 """Browser management module for BrowserTest AI"""
 
 from .browser_manager import BrowserManager
+from .playwright_singleton import get_playwright, stop_playwright
 
 __all__ = [
-    "BrowserManager"
+    "BrowserManager",
+    "get_playwright",
+    "stop_playwright"
 ]
\ No newline at end of file
@@ -1,10 +1,14 @@
 """Browser management for BrowserTest AI"""
 
-import asyncio
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
 
 from config.config import Config
 
+# Static whitelist of supported browsers; frozenset gives O(1) membership
+_SUPPORTED_BROWSERS: frozenset = frozenset({"chrome", "firefox", "safari", "edge"})
+_SUPPORTED_BROWSERS_ORDERED: Tuple[str, ...] = ("chrome", "firefox", "safari", "edge")
+
 
 class BrowserManager:
     """Manages browser configuration and settings"""
@@ -16,17 +20,13 @@ class BrowserManager:
             config: Application configuration
         """
         self.config = config
-        self.active_sessions: Dict[str, Any] = {}
-        
-    def get_browser_config(self, browser_type: Optional[str] = None) -> Dict[str, Any]:
-        """Get browser configuration for Agent initialization
-        
-        Args:
-            browser_type: Type of browser (chrome, firefox, etc.)
-            
-        Returns:
-            Browser configuration dictionary
-        """
+        self.active_sessions: "OrderedDict[str, Any]" = OrderedDict()
+        self._keys_cache: Optional[Tuple[str, ...]] = None
+        self._pool_size = config.get("browser.pool_size", 0) or 0
+        self._browser_config_template = self._build_browser_config()
+
+    def _build_browser_config(self) -> Dict[str, Any]:
+        """Build the browser configuration dictionary from config"""
         return {
             "headless": self.config.get("browser.headless", False),
             "viewport": {
@@ -36,37 +36,93 @@ class BrowserManager:
             "user_data_dir": self.config.get("browser.user_data_dir"),
             "downloads_path": self.config.get("browser.downloads_path", "./downloads")
         }
+
+    def invalidate(self):
+        """Rebuild the cached browser configuration after config changes"""
+        self._browser_config_template = self._build_browser_config()
+
+    def get_browser_config(self, browser_type: Optional[str] = None) -> Dict[str, Any]:
+        """Get browser configuration for Agent initialization
+
+        Args:
+            browser_type: Type of browser (chrome, firefox, etc.)
+
+        Returns:
+            Browser configuration dictionary
+        """
+        config = dict(self._browser_config_template)
+        config["viewport"] = dict(config["viewport"])
+        return config
         
     def register_session(self, session_id: str, agent: Any):
         """Register an active browser session
-        
+
+        Sessions are kept in least-recently-used order; when a pool size is
+        configured, registering beyond the cap evicts the LRU session.
+
         Args:
             session_id: Unique session identifier
             agent: Browser-use Agent instance
         """
         self.active_sessions[session_id] = agent
-    
+        self.active_sessions.move_to_end(session_id)
+        self._keys_cache = None
+        if self._pool_size:
+            while len(self.active_sessions) > self._pool_size:
+                self.evict_lru()
+
+    def touch(self, session_id: str):
+        """Mark a session as recently used
+
+        Args:
+            session_id: Session identifier to touch
+        """
+        self.active_sessions.move_to_end(session_id)
+        self._keys_cache = None
+
+    def evict_lru(self) -> Optional[Tuple[str, Any]]:
+        """Evict the least-recently-used session
+
+        Returns:
+            Tuple of (session_id, agent) or None if no sessions exist
+        """
+        if not self.active_sessions:
+            return None
+        self._keys_cache = None
+        return self.active_sessions.popitem(last=False)
+
     def unregister_session(self, session_id: str):
         """Unregister a browser session
         
         Args:
             session_id: Session identifier to remove
         """
-        if session_id in self.active_sessions:
-            del self.active_sessions[session_id]
+        if self.active_sessions.pop(session_id, None) is not None:
+            self._keys_cache = None
     
     async def cleanup(self):
         """Cleanup all resources"""
         # Browser cleanup is now handled by individual agents
         self.active_sessions.clear()
-    
-    def get_active_sessions(self) -> List[str]:
-        """Get list of active browser session keys
-        
+        self._keys_cache = None
+
+    def get_active_sessions(self) -> Tuple[str, ...]:
+        """Get active browser session keys
+
         Returns:
-            List of active session keys
+            Tuple of active session keys, cached until sessions change
         """
-        return list(self.active_sessions.keys())
+        if self._keys_cache is None:
+            self._keys_cache = tuple(self.active_sessions.keys())
+        return self._keys_cache
+
+    def active_session_view(self):
+        """Get a zero-copy view of the active session keys
+
+        Returns:
+            Keys view over the active sessions
+        """
+        return self.active_sessions.keys()
     
     def get_session_count(self) -> int:
         """Get number of active browser sessions
@@ -76,10 +132,21 @@ class BrowserManager:
         """
         return len(self.active_sessions)
     
-    def get_browser_types(self) -> List[str]:
+    def get_browser_types(self) -> Tuple[str, ...]:
         """Get supported browser types
-        
+
+        Returns:
+            Tuple of supported browser types
+        """
+        return _SUPPORTED_BROWSERS_ORDERED
+
+    def is_supported_browser(self, browser_type: str) -> bool:
+        """Check whether a browser type is supported
+
+        Args:
+            browser_type: Browser type name to check
+
         Returns:
-            List of supported browser types
+            True if the browser type is supported
         """
-        return ["chrome", "firefox", "safari", "edge"]
\ No newline at end of file
+        return browser_type in _SUPPORTED_BROWSERS
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""Shared Playwright driver for BrowserTest AI
+
+Starting the Playwright driver spawns a node subprocess and takes
+hundreds of milliseconds; scripts that open several browser sessions
+should share one driver instead of paying that cost per session.
+"""
+
+import asyncio
+from typing import Any, Optional
+
+_playwright: Optional[Any] = None
+_lock = asyncio.Lock()
+
+
+async def get_playwright() -> Any:
+    """Get the shared Playwright driver, starting it on first use
+
+    Returns:
+        The started Playwright driver instance
+    """
+    global _playwright
+    async with _lock:
+        if _playwright is None:
+            from playwright.async_api import async_playwright
+            _playwright = await async_playwright().start()
+        return _playwright
+
+
+async def stop_playwright():
+    """Stop the shared Playwright driver if it was started"""
+    global _playwright
+    async with _lock:
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
@@ -1,11 +1,6 @@
 """Configuration management module for BrowserTest AI."""
 
 from .config import Config
-from .yaml_loader import YAMLLoader
-from .yaml_schema import (
-    TestCase, TestSuite, BrowserConfig,
-    YAMLSchemaValidator, BrowserType
-)
 
 __all__ = [
     "Config",
@@ -15,4 +10,28 @@ __all__ = [
     "BrowserConfig",
     "YAMLSchemaValidator",
     "BrowserType",
-]
\ No newline at end of file
+]
+
+# Names resolved lazily so importing the package (e.g. for Config alone)
+# doesn't pull in PyYAML and the schema module.
+_LAZY_IMPORTS = {
+    "YAMLLoader": "yaml_loader",
+    "TestCase": "yaml_schema",
+    "TestSuite": "yaml_schema",
+    "BrowserConfig": "yaml_schema",
+    "YAMLSchemaValidator": "yaml_schema",
+    "BrowserType": "yaml_schema",
+}
+
+
+def __getattr__(name):
+    """Lazily import the YAML loader/schema names on first access (PEP 562)"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
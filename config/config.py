@@ -1,9 +1,84 @@
 """Main configuration class for BrowserTest AI"""
 
+import functools
 import os
-from typing import Dict, Any, Optional
+import types
+from typing import Any, Callable, Dict, Optional
 from pathlib import Path
-from dotenv import load_dotenv
+from dotenv import dotenv_values
+
+# Sentinel used to cache "key not found" results in the lookup cache
+_MISSING = object()
+
+# Parsed .env contents shared by all Config instances, keyed by file mtime
+_DOTENV_CACHE: Optional[tuple] = None
+
+
+@functools.lru_cache(maxsize=1)
+def _env_snapshot() -> types.MappingProxyType:
+    """Read-only snapshot of os.environ, taken once per process"""
+    return types.MappingProxyType(dict(os.environ))
+
+
+# Accepted truthy spellings for boolean environment variables
+_TRUE = frozenset({"true", "1", "yes", "on"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse an environment variable string as a boolean"""
+    return value.lower() in _TRUE
+
+
+# Declarative environment schema: (dotted key, env var, default, cast).
+# Casts run only on values actually present in the environment.
+_ENV_SPEC = (
+    ("llm.provider", "LLM_PROVIDER", "google", None),
+    ("llm.google_api_key", "GOOGLE_API_KEY", None, None),
+    ("llm.openai_api_key", "OPENAI_API_KEY", None, None),
+    ("llm.openai_base_url", "OPENAI_BASE_URL", None, None),
+    ("llm.model", "LLM_MODEL", "gemini-2.0-flash-exp", None),
+    ("browser.headless", "BROWSER_HEADLESS", True, _parse_bool),
+    ("browser.browser_type", "BROWSER_TYPE", "chromium", None),
+    ("browser.timeout", "BROWSER_TIMEOUT", 30000, int),
+    ("browser.pool_size", "BROWSER_POOL_SIZE", 3, int),
+    ("execution.parallel_workers", "PARALLEL_WORKERS", 2, int),
+    ("execution.max_retries", "MAX_RETRIES", 3, int),
+    ("execution.retry_delay", "RETRY_DELAY", 5, int),
+    ("reporting.output_dir", "OUTPUT_DIR", "reports", None),
+    ("reporting.format", "REPORT_FORMAT", "html,json", None),
+    ("reporting.screenshots", "SCREENSHOTS", True, _parse_bool),
+    ("base_url", "BASE_URL", None, None),
+)
+
+
+def _load_dotenv_cached(env_file: Path):
+    """Parse .env once per mtime and merge values into os.environ
+
+    Re-parses only when the file changes; values never override variables
+    already present in the environment.
+    """
+    global _DOTENV_CACHE
+    mtime = env_file.stat().st_mtime
+    if _DOTENV_CACHE is None or _DOTENV_CACHE[0] != mtime:
+        values = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+        _DOTENV_CACHE = (mtime, values)
+
+    merged = False
+    for name, value in _DOTENV_CACHE[1].items():
+        if name not in os.environ:
+            os.environ[name] = value
+            merged = True
+    if merged:
+        # New variables were added; drop the stale snapshot
+        _env_snapshot.cache_clear()
+
+
+def _env_get(name: str, default: Any = None, cast: Optional[Callable[[str], Any]] = None) -> Any:
+    """Get an environment variable from the snapshot, applying an optional cast"""
+    value = _env_snapshot().get(name)
+    if value is None:
+        return default
+    return cast(value) if cast else value
 
 
 class Config:
@@ -16,6 +91,7 @@ class Config:
             config_file: Optional path to configuration file
         """
         self._config = {}
+        self._get_cache: Dict[str, Any] = {}
         self._load_environment()
         if config_file:
             self._load_config_file(config_file)
@@ -25,36 +101,21 @@ class Config:
         # Load .env file if it exists
         env_file = Path(".env")
         if env_file.exists():
-            load_dotenv(env_file)
+            _load_dotenv_cached(env_file)
         
-        # Core settings
-        self._config.update({
-            "llm": {
-                "provider": os.getenv("LLM_PROVIDER", "google"),
-                "google_api_key": os.getenv("GOOGLE_API_KEY"),
-                "openai_api_key": os.getenv("OPENAI_API_KEY"),
-                "openai_base_url": os.getenv("OPENAI_BASE_URL"),
-                "model": os.getenv("LLM_MODEL", "gemini-2.0-flash-exp"),
-            },
-            "browser": {
-                "headless": os.getenv("BROWSER_HEADLESS", "true").lower() == "true",
-                "browser_type": os.getenv("BROWSER_TYPE", "chromium"),
-                "timeout": int(os.getenv("BROWSER_TIMEOUT", "30000")),
-                "pool_size": int(os.getenv("BROWSER_POOL_SIZE", "3")),
-            },
-            "execution": {
-                "parallel_workers": int(os.getenv("PARALLEL_WORKERS", "2")),
-                "max_retries": int(os.getenv("MAX_RETRIES", "3")),
-                "retry_delay": int(os.getenv("RETRY_DELAY", "5")),
-            },
-            "reporting": {
-                "output_dir": os.getenv("OUTPUT_DIR", "reports"),
-                "format": os.getenv("REPORT_FORMAT", "html,json"),
-                "screenshots": os.getenv("SCREENSHOTS", "true").lower() == "true",
-            },
-            "base_url": os.getenv("BASE_URL")
-        })
+        # Core settings, driven by the declarative schema
+        for dotted_key, env_name, default, cast in _ENV_SPEC:
+            self.set(dotted_key, _env_get(env_name, default, cast))
     
+    @staticmethod
+    def reload_env():
+        """Invalidate the cached environment snapshot
+
+        Call this after mutating os.environ so that newly constructed
+        Config instances see the updated values.
+        """
+        _env_snapshot.cache_clear()
+
     def _load_config_file(self, config_file: str):
         """Load configuration from file
         
@@ -74,16 +135,24 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        # Fast path: top-level keys need no split or walk
+        if '.' not in key:
+            value = self._config.get(key, _MISSING)
+            return default if value is _MISSING else value
+
+        try:
+            value = self._get_cache[key]
+        except KeyError:
+            value = self._config
+            for k in key.split('.'):
+                if isinstance(value, dict) and k in value:
+                    value = value[k]
+                else:
+                    value = _MISSING
+                    break
+            self._get_cache[key] = value
+
+        return default if value is _MISSING else value
     
     def set(self, key: str, value: Any):
         """Set configuration value using dot notation
@@ -92,14 +161,18 @@ class Config:
             key: Configuration key (e.g., 'llm.provider')
             value: Value to set
         """
+        self._get_cache.clear()
+
+        if '.' not in key:
+            self._config[key] = value
+            return
+
         keys = key.split('.')
         config = self._config
-        
+
         for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
-        
+            config = config.setdefault(k, {})
+
         config[keys[-1]] = value
     
     def get_all(self) -> Dict[str, Any]:
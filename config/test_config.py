@@ -5,8 +5,11 @@ import sys
 import os
 from pathlib import Path
 
+# Resolve once; per-function Path(__file__) calls redo the symlink walk
+_MODULE_DIR = Path(__file__).resolve().parent
+
 # Add current directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(_MODULE_DIR))
 
 from yaml_schema import (
     TestSuite, TestCase, BrowserConfig, YAMLSchemaValidator,
@@ -102,7 +105,7 @@ def test_yaml_loader():
         print(f"✅ Schema template generated with {len(template['tests'])} test(s)")
         
         # Test creating a temporary YAML file
-        temp_file = Path(__file__).parent / "temp_test.yaml"
+        temp_file = _MODULE_DIR / "temp_test.yaml"
         YAMLLoader.create_template(str(temp_file))
         print(f"✅ Template YAML file created: {temp_file}")
         
@@ -127,7 +130,7 @@ def test_example_yaml():
     
     try:
         # Path to example YAML file
-        example_file = Path(__file__).parent.parent / "test_suites" / "examples" / "example_test_suite.yaml"
+        example_file = _MODULE_DIR.parent / "test_suites" / "examples" / "example_test_suite.yaml"
         
         if not example_file.exists():
             print(f"❌ Example file not found: {example_file}")
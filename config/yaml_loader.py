@@ -1,18 +1,85 @@
 #!/usr/bin/env python3
 """Simplified YAML loader for prompt-based test configurations"""
 
+import copy
+import functools
+import hashlib
+import pickle
 import yaml
+from collections import OrderedDict
 from typing import Dict, Any, List
 from pathlib import Path
+
 from .yaml_schema import (
     TestSuite, TestCase, BrowserConfig,
-    YAMLSchemaValidator, BrowserType
+    YAMLSchemaValidator, BrowserType,
+    SchemaLoader as _Loader, SchemaDumper as _Dumper, load_yaml,
+    _BROWSER_TYPE_MAP
+)
+
+class _SuiteDumper(_Dumper):
+    """Dumper for test suite export
+
+    Skips anchor/alias emission so that objects shared across tests (the
+    default browser config, merged variables) serialize as plain values.
+    """
+
+    def ignore_aliases(self, data):
+        return True
+
+
+# Emit BrowserType enums as plain strings so serialization can pass them
+# through without unwrapping .value per field
+_SuiteDumper.add_representer(
+    BrowserType,
+    lambda dumper, browser_type: dumper.represent_str(browser_type.value)
 )
 
+# Content-addressed LRU of built suites: blake2b(file bytes) -> (TestSuite, errors)
+_SUITE_CACHE: "OrderedDict[bytes, tuple]" = OrderedDict()
+_SUITE_CACHE_MAXSIZE = 2000
+_suite_cache_hits = 0
+_suite_cache_misses = 0
+
+# Stat-validated LRU: resolved path -> (mtime_ns, size, TestSuite). An
+# unchanged file skips the read and hash entirely; the cached suite is
+# handed out as a deep copy because callers mutate what they load.
+_STAT_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_STAT_CACHE_MAXSIZE = 100
+
+
+def suite_cache_hit_rate() -> float:
+    """Fraction of load_test_suite calls served from the content cache"""
+    total = _suite_cache_hits + _suite_cache_misses
+    return _suite_cache_hits / total if total else 0.0
+
+
+@functools.cache
+def _render_template_bytes() -> bytes:
+    """Serialize the schema template once; later calls reuse the bytes"""
+    text = yaml.dump(
+        YAMLSchemaValidator._template(),
+        Dumper=_SuiteDumper, default_flow_style=False, indent=2, sort_keys=False
+    )
+    return text.encode('utf-8')
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, cached on (path, mtime, size)
+
+    Repeated loads of an unchanged file (e.g. validate followed by load)
+    skip both the read and the parse.
+    """
+    return load_yaml(path_str)
+
 
 class YAMLLoader:
     """Loads and validates YAML test configurations"""
-    
+
+    # On-disk cache of built suites for cross-process reuse
+    _PICKLE_CACHE_DIR = Path('.cache/suites')
+
     @staticmethod
     def load_test_suite(file_path: str) -> TestSuite:
         """Load test suite from YAML file
@@ -28,20 +95,86 @@ class YAMLLoader:
             yaml.YAMLError: If YAML is invalid
             ValueError: If validation fails
         """
+        global _suite_cache_hits, _suite_cache_misses
+
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"Test suite file not found: {file_path}")
-        
-        with open(path, 'r', encoding='utf-8') as file:
-            data = yaml.safe_load(file)
-        
-        # Validate schema
-        errors = YAMLSchemaValidator.validate_test_suite(data)
+
+        stat = path.stat()
+        path_key = str(path.resolve())
+        stat_entry = _STAT_CACHE.get(path_key)
+        if stat_entry is not None and stat_entry[0] == stat.st_mtime_ns and stat_entry[1] == stat.st_size:
+            _STAT_CACHE.move_to_end(path_key)
+            _suite_cache_hits += 1
+            return copy.deepcopy(stat_entry[2])
+
+        raw = path.read_bytes()
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+
+        entry = _SUITE_CACHE.get(digest)
+        if entry is not None:
+            _SUITE_CACHE.move_to_end(digest)
+            _suite_cache_hits += 1
+        else:
+            _suite_cache_misses += 1
+            data = yaml.load(raw, Loader=_Loader)
+            # Validate and construct in a single pass over the data
+            test_suite, errors = YAMLLoader._validate_and_build(data)
+            entry = (test_suite, tuple(errors))
+            _SUITE_CACHE[digest] = entry
+            while len(_SUITE_CACHE) > _SUITE_CACHE_MAXSIZE:
+                _SUITE_CACHE.popitem(last=False)
+
+        test_suite, errors = entry
         if errors:
             raise ValueError(f"YAML validation failed:\n" + "\n".join(errors))
-        
-        return YAMLLoader._create_test_suite(data)
+
+        _STAT_CACHE[path_key] = (stat.st_mtime_ns, stat.st_size, test_suite)
+        _STAT_CACHE.move_to_end(path_key)
+        while len(_STAT_CACHE) > _STAT_CACHE_MAXSIZE:
+            _STAT_CACHE.popitem(last=False)
+
+        return copy.deepcopy(test_suite)
     
+    @staticmethod
+    def load_test_suite_cached(file_path: str) -> TestSuite:
+        """Load a test suite through an on-disk pickle cache
+
+        The cache file is keyed on the resolved path and mtime, so
+        repeated script invocations skip YAML parsing and validation
+        entirely; a changed file gets a new key and is re-parsed.
+
+        Args:
+            file_path: Path to YAML file
+
+        Returns:
+            TestSuite object
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Test suite file not found: {file_path}")
+
+        stat = path.stat()
+        path_key = hashlib.blake2b(str(path.resolve()).encode('utf-8'), digest_size=8).hexdigest()
+        cache_file = YAMLLoader._PICKLE_CACHE_DIR / f"{path_key}_{stat.st_mtime_ns}.pkl"
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'rb') as handle:
+                    return pickle.load(handle)
+            except (OSError, pickle.UnpicklingError):
+                pass
+
+        test_suite = YAMLLoader.load_test_suite(file_path)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'wb') as handle:
+                pickle.dump(test_suite, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+
+        return test_suite
+
     @staticmethod
     def validate_schema(file_path: str) -> List[str]:
         """Validate YAML file against schema without loading
@@ -57,9 +190,9 @@ class YAMLLoader:
             if not path.exists():
                 return [f"File not found: {file_path}"]
             
-            with open(path, 'r', encoding='utf-8') as file:
-                data = yaml.safe_load(file)
-            
+            stat = path.stat()
+            data = _parse_yaml_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
             return YAMLSchemaValidator.validate_test_suite(data)
         
         except yaml.YAMLError as e:
@@ -81,8 +214,8 @@ class YAMLLoader:
         path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(path, 'w', encoding='utf-8') as file:
-            yaml.dump(data, file, default_flow_style=False, indent=2, sort_keys=False)
-    
+            yaml.dump(data, file, Dumper=_SuiteDumper, default_flow_style=False, indent=2, sort_keys=False)
+
     @staticmethod
     def create_template(file_path: str) -> None:
         """Create a template YAML file
@@ -90,27 +223,96 @@ class YAMLLoader:
         Args:
             file_path: Output file path for template
         """
-        template = YAMLSchemaValidator.get_schema_template()
-        
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(path, 'w', encoding='utf-8') as file:
-            yaml.dump(template, file, default_flow_style=False, indent=2, sort_keys=False)
+        path.write_bytes(_render_template_bytes())
     
     @staticmethod
-    def _create_test_suite(data: Dict[str, Any]) -> TestSuite:
-        """Create TestSuite object from validated data"""
-        # Extract tests
+    def create_sample_configs_bulk(file_paths: List[str]) -> None:
+        """Write the sample template to several paths concurrently
+
+        The template is rendered to bytes once and the writes run on a
+        small thread pool, overlapping the file I/O.
+
+        Args:
+            file_paths: Output file paths for the sample configs
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        rendered = _render_template_bytes()
+
+        def _write(file_path: str) -> None:
+            path = Path(file_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(rendered)
+
+        with ThreadPoolExecutor(max_workers=len(file_paths)) as executor:
+            list(executor.map(_write, file_paths))
+
+    @staticmethod
+    def _validate_and_build(data: Dict[str, Any]) -> tuple:
+        """Validate raw suite data and build the TestSuite in one pass
+
+        Each test node is visited once: its fields are validated and, while
+        the suite is still error-free, the TestCase is constructed inline.
+
+        Returns:
+            Tuple of (TestSuite or None, list of validation errors)
+        """
+        errors = YAMLSchemaValidator.validate_suite_fields(data)
+
         tests = []
-        for test_data in data.get('tests', []):
-            test_case = YAMLLoader._create_test_case(test_data, data)
-            tests.append(test_case)
-        
-        # Create default browser config
+        tests_data = data.get('tests')
+        if isinstance(tests_data, list):
+            # Resolve suite-level defaults once instead of per test case
+            default_browser_data = data.get('default_browser', {})
+            default_llm_provider = data.get('default_llm_provider', 'google')
+            default_llm_model = data.get('default_llm_model')
+            suite_variables = data.get('variables', {})
+
+            for i, test_data in enumerate(tests_data):
+                start = len(errors)
+                YAMLSchemaValidator.validate_test_case(test_data, errors)
+                if len(errors) > start:
+                    for j in range(start, len(errors)):
+                        errors[j] = f"Test {i+1}: {errors[j]}"
+                elif not errors:
+                    tests.append(YAMLLoader._create_test_case(
+                        test_data,
+                        default_browser_data,
+                        default_llm_provider,
+                        default_llm_model,
+                        suite_variables
+                    ))
+
+        if errors:
+            return None, errors
+
+        return YAMLLoader._create_test_suite(data, tests), []
+
+    @staticmethod
+    def _create_test_suite(data: Dict[str, Any], tests: List[TestCase] = None) -> TestSuite:
+        """Create TestSuite object from validated data"""
+        # Resolve suite-level defaults once instead of per test case
         default_browser_data = data.get('default_browser', {})
         default_browser = YAMLLoader._create_browser_config(default_browser_data)
-        
+        default_llm_provider = data.get('default_llm_provider', 'google')
+        default_llm_model = data.get('default_llm_model')
+        suite_variables = data.get('variables', {})
+
+        # Extract tests unless already built by _validate_and_build
+        if tests is None:
+            tests = [
+                YAMLLoader._create_test_case(
+                    test_data,
+                    default_browser_data,
+                    default_llm_provider,
+                    default_llm_model,
+                    suite_variables
+                )
+                for test_data in data.get('tests', [])
+            ]
+
         # Create test suite
         test_suite = TestSuite(
             name=data['name'],
@@ -119,34 +321,39 @@ class YAMLLoader:
             parallel=data.get('parallel', False),
             max_workers=data.get('max_workers', 2),
             fail_fast=data.get('fail_fast', False),
+            batch_prompts=data.get('batch_prompts', False),
 
             default_browser=default_browser,
-            default_llm_provider=data.get('default_llm_provider', 'google'),
-            default_llm_model=data.get('default_llm_model'),
+            default_llm_provider=default_llm_provider,
+            default_llm_model=default_llm_model,
             base_url=data.get('base_url', ''),
             setup_prompt=data.get('setup_prompt', ''),
             teardown_prompt=data.get('teardown_prompt', ''),
-            variables=data.get('variables', {}),
+            variables=suite_variables,
             data_sources=data.get('data_sources', {}),
-            report_format=data.get('report_format', ['html', 'json']),
+            report_format=data.get('report_format'),
             output_dir=data.get('output_dir', 'reports')
         )
         
         return test_suite
     
     @staticmethod
-    def _create_test_case(test_data: Dict[str, Any], suite_data: Dict[str, Any]) -> TestCase:
-        """Create TestCase object from test data"""
+    def _create_test_case(
+        test_data: Dict[str, Any],
+        default_browser_data: Dict[str, Any],
+        default_llm_provider: str,
+        default_llm_model: Any,
+        suite_variables: Dict[str, Any]
+    ) -> TestCase:
+        """Create TestCase object from test data and pre-resolved suite defaults"""
         # Inherit defaults from suite
-        default_browser_data = suite_data.get('default_browser', {})
         test_browser_data = test_data.get('browser', default_browser_data)
         browser = YAMLLoader._create_browser_config(test_browser_data)
-        
-        # Merge variables
-        suite_variables = suite_data.get('variables', {})
+
+        # Merge variables; reuse the suite dict when the test adds none
         test_variables = test_data.get('variables', {})
-        merged_variables = {**suite_variables, **test_variables}
-        
+        merged_variables = {**suite_variables, **test_variables} if test_variables else suite_variables
+
         # Create test case
         test_case = TestCase(
             name=test_data['name'],
@@ -160,8 +367,8 @@ class YAMLLoader:
             environment=test_data.get('environment', 'production'),
 
             browser=browser,
-            llm_provider=test_data.get('llm_provider', suite_data.get('default_llm_provider', 'google')),
-            llm_model=test_data.get('llm_model', suite_data.get('default_llm_model')),
+            llm_provider=test_data.get('llm_provider', default_llm_provider),
+            llm_model=test_data.get('llm_model', default_llm_model),
             llm_temperature=test_data.get('llm_temperature', 0.1),
             max_actions=test_data.get('max_actions', 50),
             variables=merged_variables,
@@ -174,22 +381,41 @@ class YAMLLoader:
     
     @staticmethod
     def _create_browser_config(browser_data: Dict[str, Any]) -> BrowserConfig:
-        """Create BrowserConfig object from browser data"""
+        """Create BrowserConfig object from browser data
+
+        Always constructs a fresh instance — tests mutate their browser
+        config, so handing a shared default to every test would alias them.
+        """
         if not browser_data:
             return BrowserConfig()
-        
+
         return BrowserConfig(
-            type=BrowserType(browser_data.get('type', 'chromium')),
+            type=_BROWSER_TYPE_MAP.get(browser_data.get('type', 'chromium'), BrowserType.CHROMIUM),
             headless=browser_data.get('headless', True),
-            viewport=browser_data.get('viewport', {'width': 1920, 'height': 1080}),
+            viewport=browser_data.get('viewport'),
             timeout=browser_data.get('timeout', 30000),
             slow_mo=browser_data.get('slow_mo', 0),
             args=browser_data.get('args', [])
         )
     
+    @staticmethod
+    def _browser_to_dict(browser: BrowserConfig) -> Dict[str, Any]:
+        """Convert BrowserConfig object to dictionary for YAML export"""
+        return {
+            'type': browser.type,
+            'headless': browser.headless,
+            'viewport': browser.viewport,
+            'timeout': browser.timeout,
+            'slow_mo': browser.slow_mo,
+            'args': browser.args
+        }
+
     @staticmethod
     def _test_suite_to_dict(test_suite: TestSuite) -> Dict[str, Any]:
         """Convert TestSuite object to dictionary for YAML export"""
+        default_browser = test_suite.default_browser
+        default_browser_dict = YAMLLoader._browser_to_dict(default_browser)
+
         return {
             'name': test_suite.name,
             'description': test_suite.description,
@@ -198,14 +424,7 @@ class YAMLLoader:
             'max_workers': test_suite.max_workers,
             'fail_fast': test_suite.fail_fast,
 
-            'default_browser': {
-                'type': test_suite.default_browser.type.value,
-                'headless': test_suite.default_browser.headless,
-                'viewport': test_suite.default_browser.viewport,
-                'timeout': test_suite.default_browser.timeout,
-                'slow_mo': test_suite.default_browser.slow_mo,
-                'args': test_suite.default_browser.args
-            },
+            'default_browser': default_browser_dict,
             'setup_prompt': test_suite.setup_prompt,
             'teardown_prompt': test_suite.teardown_prompt,
             'variables': test_suite.variables,
@@ -221,14 +440,10 @@ class YAMLLoader:
                     'retry_count': test.retry_count,
                     'tags': test.tags,
 
-                    'browser': {
-                        'type': test.browser.type.value,
-                        'headless': test.browser.headless,
-                        'viewport': test.browser.viewport,
-                        'timeout': test.browser.timeout,
-                        'slow_mo': test.browser.slow_mo,
-                        'args': test.browser.args
-                    },
+                    'browser': (
+                        default_browser_dict if test.browser is default_browser
+                        else YAMLLoader._browser_to_dict(test.browser)
+                    ),
                     'llm_model': test.llm_model,
                     'llm_temperature': test.llm_temperature,
                     'max_actions': test.max_actions,
@@ -1,12 +1,34 @@
 #!/usr/bin/env python3
 """Simplified YAML schema for prompt-based browser testing"""
 
+import copy
+import types
 import yaml
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
 
+# Prefer libyaml's C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SchemaLoader, CSafeDumper as SchemaDumper
+except ImportError:
+    from yaml import SafeLoader as SchemaLoader, SafeDumper as SchemaDumper
+
+
+def load_yaml(path) -> Any:
+    """Load a YAML document from a file using the fast loader
+
+    Reads in binary mode so decoding happens inside libyaml.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML document
+    """
+    return yaml.load(Path(path).read_bytes(), Loader=SchemaLoader)
+
 
 class BrowserType(Enum):
     """Supported browser types"""
@@ -17,25 +39,40 @@ class BrowserType(Enum):
     EDGE = "edge"
 
 
+# Precomputed value -> member map; Enum.__call__ is a comparatively slow path
+_BROWSER_TYPE_MAP = BrowserType._value2member_map_
+
+# Default field values, copied per instance in __post_init__ — handing
+# out the shared object would let one instance's mutation leak into all
+# the others and into future defaults
+_DEFAULT_VIEWPORT: Dict[str, int] = {"width": 1920, "height": 1080}
+_DEFAULT_REPORT_FORMAT: List[str] = ["html", "json"]
 
 
 
-@dataclass
+
+
+@dataclass(slots=True)
 class BrowserConfig:
     """Browser configuration for test execution"""
     type: BrowserType = BrowserType.CHROMIUM
     headless: bool = True
-    viewport: Dict[str, int] = field(default_factory=lambda: {"width": 1920, "height": 1080})
+    viewport: Optional[Dict[str, int]] = None
     timeout: int = 30000
     slow_mo: int = 0
     args: List[str] = field(default_factory=list)
-    
+
     def __post_init__(self):
-        if isinstance(self.type, str):
-            self.type = BrowserType(self.type)
+        if self.viewport is None:
+            self.viewport = dict(_DEFAULT_VIEWPORT)
+        if type(self.type) is str:
+            try:
+                self.type = _BROWSER_TYPE_MAP[self.type]
+            except KeyError:
+                raise ValueError(f"'{self.type}' is not a valid BrowserType") from None
 
 
-@dataclass
+@dataclass(slots=True)
 class TestCase:
     """Simplified test case with natural language prompts"""
     name: str
@@ -71,7 +108,7 @@ class TestCase:
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TestSuite:
     """Test suite containing multiple test cases"""
     name: str
@@ -82,6 +119,7 @@ class TestSuite:
     parallel: bool = False
     max_workers: int = 2
     fail_fast: bool = False
+    batch_prompts: bool = False  # fold runs of simple tests into one agent task
     
     # Default configurations
     default_browser: BrowserConfig = field(default_factory=BrowserConfig)
@@ -98,74 +136,111 @@ class TestSuite:
     data_sources: Dict[str, str] = field(default_factory=dict)
     
     # Reporting
-    report_format: List[str] = field(default_factory=lambda: ["html", "json"])
+    report_format: Optional[List[str]] = None
     output_dir: str = "reports"
-    
+
     def __post_init__(self):
-        pass
+        if self.report_format is None:
+            self.report_format = list(_DEFAULT_REPORT_FORMAT)
+
+
+# Sentinel distinguishing "absent" from any real value in validators
+_ABSENT = object()
+
+
+def _compile_validator(required_fields, type_specs):
+    """Compile a field spec into a straight-line validator closure
+
+    Args:
+        required_fields: Tuple of field names that must be present
+        type_specs: Tuple of (field, allowed type(s), error message) rows
+
+    Returns:
+        Function mapping a data dict to a list of error strings; an
+        existing list may be passed in to accumulate across calls
+    """
+    required_fields = frozenset(required_fields)
+    # Error strings are baked in at compile time; the hot path only looks
+    # them up instead of formatting anew
+    missing_messages = {
+        field_name: f"Missing required field: {field_name}"
+        for field_name in required_fields
+    }
+
+    def validate(data: Dict[str, Any], errors: Optional[List[str]] = None) -> List[str]:
+        if errors is None:
+            errors = []
+        append = errors.append
+        get = data.get
+
+        # Set difference runs in C; sorted only on the error path
+        missing = required_fields.difference(data)
+        if missing:
+            for field_name in sorted(missing):
+                append(missing_messages[field_name])
+
+        for field_name, field_types, message in type_specs:
+            value = get(field_name, _ABSENT)
+            if value is not _ABSENT and not isinstance(value, field_types):
+                append(message)
+
+        return errors
+
+    return validate
+
+
+_VALIDATE_SUITE_FIELDS = _compile_validator(
+    ('name', 'tests'),
+    (
+        ('tests', list, "'tests' must be a list"),
+        ('parallel', bool, "'parallel' must be a boolean"),
+        ('max_workers', int, "'max_workers' must be an integer"),
+        ('fail_fast', bool, "'fail_fast' must be a boolean"),
+    ),
+)
+
+_VALIDATE_TEST_CASE = _compile_validator(
+    ('name', 'prompt'),
+    (
+        ('timeout', (int, float), "'timeout' must be a number"),
+        ('retry_count', int, "'retry_count' must be an integer"),
+        ('tags', list, "'tags' must be a list"),
+        ('variables', dict, "'variables' must be a dictionary"),
+    ),
+)
 
 
 class YAMLSchemaValidator:
     """Validator for simplified YAML test configurations"""
-    
+
+    # Built once on first access; see get_schema_template/_template
+    _TEMPLATE: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def validate_suite_fields(data: Dict[str, Any], errors: Optional[List[str]] = None) -> List[str]:
+        """Validate suite-level fields, excluding the individual test cases"""
+        return _VALIDATE_SUITE_FIELDS(data, errors)
+
     @staticmethod
     def validate_test_suite(data: Dict[str, Any]) -> List[str]:
         """Validate test suite configuration"""
-        errors = []
-        
-        # Required fields
-        required_fields = ['name', 'tests']
-        for field in required_fields:
-            if field not in data:
-                errors.append(f"Missing required field: {field}")
-        
-        # Validate tests array
-        if 'tests' in data:
-            if not isinstance(data['tests'], list):
-                errors.append("'tests' must be a list")
-            else:
-                for i, test in enumerate(data['tests']):
-                    test_errors = YAMLSchemaValidator.validate_test_case(test)
-                    for error in test_errors:
-                        errors.append(f"Test {i+1}: {error}")
-        
-        # Validate optional fields
-        if 'parallel' in data and not isinstance(data['parallel'], bool):
-            errors.append("'parallel' must be a boolean")
-        
-        if 'max_workers' in data and not isinstance(data['max_workers'], int):
-            errors.append("'max_workers' must be an integer")
-        
-        if 'fail_fast' in data and not isinstance(data['fail_fast'], bool):
-            errors.append("'fail_fast' must be a boolean")
-        
+        errors = YAMLSchemaValidator.validate_suite_fields(data)
+
+        # Validate tests array, accumulating into the same list and
+        # prefixing each test's entries in place
+        if isinstance(data.get('tests'), list):
+            for i, test in enumerate(data['tests']):
+                start = len(errors)
+                YAMLSchemaValidator.validate_test_case(test, errors)
+                for j in range(start, len(errors)):
+                    errors[j] = f"Test {i+1}: {errors[j]}"
+
         return errors
     
     @staticmethod
-    def validate_test_case(data: Dict[str, Any]) -> List[str]:
+    def validate_test_case(data: Dict[str, Any], errors: Optional[List[str]] = None) -> List[str]:
         """Validate individual test case"""
-        errors = []
-        
-        # Required fields
-        required_fields = ['name', 'prompt']
-        for field in required_fields:
-            if field not in data:
-                errors.append(f"Missing required field: {field}")
-        
-        # Validate field types
-        if 'timeout' in data and not isinstance(data['timeout'], (int, float)):
-            errors.append("'timeout' must be a number")
-        
-        if 'retry_count' in data and not isinstance(data['retry_count'], int):
-            errors.append("'retry_count' must be an integer")
-        
-        if 'tags' in data and not isinstance(data['tags'], list):
-            errors.append("'tags' must be a list")
-        
-        if 'variables' in data and not isinstance(data['variables'], dict):
-            errors.append("'variables' must be a dictionary")
-        
-        return errors
+        return _VALIDATE_TEST_CASE(data, errors)
     
     @staticmethod
     def validate_browser_config(data: Dict[str, Any]) -> List[str]:
@@ -173,8 +248,8 @@ class YAMLSchemaValidator:
         errors = []
         
         if 'type' in data:
-            valid_types = [bt.value for bt in BrowserType]
-            if data['type'] not in valid_types:
+            if data['type'] not in _BROWSER_TYPE_MAP:
+                valid_types = [bt.value for bt in BrowserType]
                 errors.append(f"Invalid browser type. Must be one of: {valid_types}")
         
         if 'headless' in data and not isinstance(data['headless'], bool):
@@ -193,9 +268,31 @@ class YAMLSchemaValidator:
         
         return errors
     
+    @classmethod
+    def get_schema_template(cls, mutable: bool = False) -> Dict[str, Any]:
+        """Get a template for creating new test suites
+
+        Args:
+            mutable: Return a deep copy that is safe to modify; by default
+                a read-only view of the shared template is returned
+
+        Returns:
+            Template dictionary
+        """
+        if mutable:
+            return copy.deepcopy(cls._template())
+        return types.MappingProxyType(cls._template())
+
+    @classmethod
+    def _template(cls) -> Dict[str, Any]:
+        """Get the shared template prototype (read-only, built once)"""
+        if cls._TEMPLATE is None:
+            cls._TEMPLATE = cls._build_template()
+        return cls._TEMPLATE
+
     @staticmethod
-    def get_schema_template() -> Dict[str, Any]:
-        """Get a template for creating new test suites"""
+    def _build_template() -> Dict[str, Any]:
+        """Build the template dictionary"""
         return {
             "name": "Example Test Suite",
             "description": "A sample test suite for browser automation",
@@ -1,13 +1,35 @@
 """LLM integration module for BrowserTest AI"""
 
 from .llm_provider import LLMProvider
-from .google_provider import GoogleProvider
-from .openai_provider import OpenAIProvider
-from .browser_use_integration import BrowserUseIntegration
 
 __all__ = [
     "LLMProvider",
-    "GoogleProvider", 
+    "GoogleProvider",
     "OpenAIProvider",
-    "BrowserUseIntegration"
-]
\ No newline at end of file
+    "GroqProvider",
+    "BrowserUseIntegration",
+    "PromptCache"
+]
+
+# Concrete providers resolved lazily so importing the package doesn't pull
+# in browser_use chat clients that aren't needed for the selected provider.
+_LAZY_IMPORTS = {
+    "GoogleProvider": "google_provider",
+    "OpenAIProvider": "openai_provider",
+    "GroqProvider": "groq_provider",
+    "BrowserUseIntegration": "browser_use_integration",
+    "PromptCache": "prompt_cache",
+}
+
+
+def __getattr__(name):
+    """Lazily import the concrete provider names on first access (PEP 562)"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -2,47 +2,76 @@ import asyncio
 from typing import Dict, Any, Optional, List
 from browser_use import Agent
 from .llm_provider import LLMProvider
+from .prompt_cache import PromptCache
 from config.config import Config
 
+# Shared across all integrations: runners construct a fresh integration
+# per test, so a per-instance cache would never accumulate hits
+PROMPT_CACHE = PromptCache()
+
+
 class BrowserUseIntegration:
     """Integration layer for browser-use library with Agent management"""
-    
+
     def __init__(self, config: Config, llm_provider: LLMProvider):
         self.config = config
         self.llm_provider = llm_provider
         self.current_agent: Optional[Agent] = None
-        
+        self._browser_config: Optional[Dict[str, Any]] = None
+        self._agent_configuration: Optional[Dict[str, Any]] = None
+        # Module-level prompt/response cache for deterministic calls;
+        # callers consult it via make_key/get/set around their requests
+        self.prompt_cache = PROMPT_CACHE
+
     def get_browser_config(self) -> Dict[str, Any]:
-        """Get browser configuration for Agent initialization"""
-        return {
-            "headless": self.config.get("browser.headless", False),
-            "viewport": {
-                "width": self.config.get("browser.viewport.width", 1920),
-                "height": self.config.get("browser.viewport.height", 1080)
-            },
-            "user_data_dir": self.config.get("browser.user_data_dir"),
-            "downloads_path": self.config.get("browser.downloads_path", "./downloads")
-        }
+        """Get browser configuration for Agent initialization
+
+        Config is immutable within a run, so the dict is built once;
+        each call hands out a fresh outer and viewport copy so caller
+        mutations cannot leak into later agents.
+        """
+        if self._browser_config is None:
+            self._browser_config = {
+                "headless": self.config.get("browser.headless", False),
+                "viewport": {
+                    "width": self.config.get("browser.viewport.width", 1920),
+                    "height": self.config.get("browser.viewport.height", 1080)
+                },
+                "user_data_dir": self.config.get("browser.user_data_dir"),
+                "downloads_path": self.config.get("browser.downloads_path", "./downloads")
+            }
+        config = dict(self._browser_config)
+        config["viewport"] = dict(config["viewport"])
+        return config
     
     async def create_agent(
         self,
         task: str,
         use_vision: Optional[bool] = None,
         max_steps: Optional[int] = None,
+        track: bool = True,
         **kwargs
     ) -> Agent:
-        """Create an Agent instance with the configured LLM"""
-        
-        # Get LLM instance from provider
-        llm = self.llm_provider.get_llm()
-        
+        """Create an Agent instance with the configured LLM
+
+        Args:
+            task: Task description for the agent
+            use_vision: Override for the provider's vision capability
+            max_steps: Maximum agent steps
+            track: Record the agent as current_agent; disabled by the
+                parallel path where the write would be racy
+        """
+
+        # Get the shared LLM instance from the provider
+        llm = self.llm_provider.llm
+
         # Set vision capability
         if use_vision is None:
             use_vision = self.llm_provider.supports_vision()
-        
+
         # Get browser configuration
         browser_config = self.get_browser_config()
-        
+
         # Create agent with current API
         agent = Agent(
             task=task,
@@ -51,8 +80,9 @@ class BrowserUseIntegration:
             max_steps=max_steps or self.config.get("browser.max_steps", 100),
             **browser_config
         )
-        
-        self.current_agent = agent
+
+        if track:
+            self.current_agent = agent
         return agent
     
     async def run_agent(
@@ -71,11 +101,11 @@ class BrowserUseIntegration:
         **kwargs
     ) -> List[Any]:
         """Run multiple agents in parallel"""
-        agents = []
-        for task in tasks:
-            agent = await self.create_agent(task, **kwargs)
-            agents.append(agent)
-        
+        # Build the agents concurrently as well; construction can involve I/O
+        agents = await asyncio.gather(
+            *[self.create_agent(task, track=False, **kwargs) for task in tasks]
+        )
+
         # Run all agents concurrently
         results = await asyncio.gather(
             *[agent.run() for agent in agents],
@@ -86,11 +116,13 @@ class BrowserUseIntegration:
     
     def get_agent_configuration(self) -> Dict[str, Any]:
         """Get current agent configuration"""
-        return {
-            "llm_provider": self.llm_provider.get_model_info(),
-            "browser_config": self.get_browser_config(),
-            "supports_vision": self.llm_provider.supports_vision()
-        }
+        if self._agent_configuration is None:
+            self._agent_configuration = {
+                "llm_provider": self.llm_provider.get_model_info(),
+                "browser_config": self.get_browser_config(),
+                "supports_vision": self.llm_provider.supports_vision()
+            }
+        return self._agent_configuration
     
     async def cleanup(self):
         """Clean up browser sessions and resources"""
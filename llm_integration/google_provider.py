@@ -11,8 +11,17 @@ class GoogleProvider(LLMProvider):
         super().__init__(config)
         self.api_key = config.get("llm.google.api_key") or os.getenv("GOOGLE_API_KEY")
         self.model_name = config.get("llm.google.model", "gemini-2.5-flash-lite")
+        self._model_name_lc = self.model_name.lower()
         self.temperature = config.get("llm.google.temperature", 0.1)
-        
+        # Resolve capability flags and the info dict once up front
+        self._model_info = {
+            "provider": "google",
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "supports_vision": self.supports_vision(),
+            "api_key_configured": bool(self.api_key)
+        }
+
     def get_llm(self):
         """Return ChatGoogle instance compatible with browser-use Agent"""
         if self._llm is None:
@@ -42,13 +51,7 @@ class GoogleProvider(LLMProvider):
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get Google model information"""
-        return {
-            "provider": "google",
-            "model": self.model_name,
-            "temperature": self.temperature,
-            "supports_vision": self.supports_vision(),
-            "api_key_configured": bool(self.api_key)
-        }
+        return self._model_info
     
     def get_model_name(self) -> str:
         """Get the model name/identifier"""
@@ -57,4 +60,4 @@ class GoogleProvider(LLMProvider):
     def supports_function_calling(self) -> bool:
         """Check if the model supports function calling"""
         # Most Gemini models support function calling
-        return "gemini" in self.model_name.lower()
\ No newline at end of file
+        return "gemini" in self._model_name_lc
\ No newline at end of file
@@ -1,9 +1,26 @@
+import functools
 import os
+import re
 from typing import Dict, Any
 from browser_use.llm import ChatGroq
 from .llm_provider import LLMProvider
 from config.config import Config
 
+_FUNCTION_CALLING_RE = re.compile("|".join(map(re.escape, ('llama-3.3', 'llama-3.1', 'mixtral'))))
+
+
+@functools.lru_cache(maxsize=32)
+def _supports_function_calling(model_name: str) -> bool:
+    """Check a lowercased Groq model name for function-calling support"""
+    return _FUNCTION_CALLING_RE.search(model_name) is not None
+
+
+@functools.lru_cache(maxsize=32)
+def _supports_vision(model_name: str) -> bool:
+    """Check a lowercased Groq model name for vision support"""
+    return 'llava' in model_name
+
+
 class GroqProvider(LLMProvider):
     """Groq LLM provider for browser-use integration"""
     
@@ -11,9 +28,20 @@ class GroqProvider(LLMProvider):
         super().__init__(config)
         self.api_key = config.get("llm.groq.api_key") or os.getenv("GROQ_API_KEY")
         self.model_name = config.get("llm.groq.model", "meta-llama/llama-4-scout-17b-16e-instruct")
+        self._model_name_lc = self.model_name.lower()
         self.temperature = config.get("llm.groq.temperature", 0.1)
         self.max_tokens = config.get("llm.groq.max_tokens", 8192)
-        
+        # Resolve capability flags and the info dict once up front
+        self._supports_vision = _supports_vision(self._model_name_lc)
+        self._model_info = {
+            "provider": "groq",
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "supports_vision": self._supports_vision,
+            "api_key_configured": bool(self.api_key)
+        }
+
     def get_llm(self):
         """Return ChatGroq instance compatible with browser-use Agent"""
         if self._llm is None:
@@ -43,14 +71,7 @@ class GroqProvider(LLMProvider):
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get Groq model information"""
-        return {
-            "provider": "groq",
-            "model": self.model_name,
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens,
-            "supports_vision": self.supports_vision(),
-            "api_key_configured": bool(self.api_key)
-        }
+        return self._model_info
     
     def get_model_name(self) -> str:
         """Get the model name/identifier"""
@@ -59,12 +80,10 @@ class GroqProvider(LLMProvider):
     def supports_function_calling(self) -> bool:
         """Check if the model supports function calling"""
         # Most Groq models support function calling
-        function_calling_models = ['llama-3.3', 'llama-3.1', 'mixtral']
-        return any(model in self.model_name.lower() for model in function_calling_models)
-    
+        return _supports_function_calling(self._model_name_lc)
+
     def supports_vision(self) -> bool:
         """Check if the model supports vision capabilities"""
         # Currently, most Groq models don't support vision
         # This may change in the future
-        vision_models = ['llava']
-        return any(vision_model in self.model_name.lower() for vision_model in vision_models)
\ No newline at end of file
+        return self._supports_vision
\ No newline at end of file
@@ -1,9 +1,23 @@
 """Abstract LLM provider interface for BrowserTest AI"""
 
+import functools
+import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 from config.config import Config
 
+# Provider instances cached by (provider type, config identity)
+_PROVIDER_CACHE: Dict[Tuple[str, int], 'LLMProvider'] = {}
+
+_VISION_MODELS = ('gpt-4o', 'gpt-4-vision', 'claude-3', 'gemini-pro-vision', 'gemini-1.5', 'llava')
+_VISION_RE = re.compile("|".join(map(re.escape, _VISION_MODELS)))
+
+
+@functools.lru_cache(maxsize=128)
+def _vision_ok(model_name: str) -> bool:
+    """Check a lowercased model name against the known vision models"""
+    return _VISION_RE.search(model_name) is not None
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers compatible with browser-use"""
@@ -11,11 +25,27 @@ class LLMProvider(ABC):
     def __init__(self, config: Config):
         self.config = config
         self._llm = None
+        # Subclasses set this once model_name is known to skip per-call .lower()
+        self._model_name_lc: Optional[str] = None
+        # Vision flag resolved once per instance
+        self._supports_vision: Optional[bool] = None
         
     @abstractmethod
     def get_llm(self):
         """Return the LLM instance compatible with browser-use Agent"""
         pass
+
+    @property
+    def llm(self):
+        """The cached LLM instance, built on first access
+
+        One chat-client instance is deliberately shared across agents; the
+        browser-use chat clients are stateless request wrappers, so reuse
+        is safe for concurrent agents and avoids rebuilding the client per
+        agent.
+        """
+        cached = self._llm
+        return cached if cached is not None else self.get_llm()
         
     @abstractmethod
     def validate_credentials(self) -> bool:
@@ -41,21 +71,42 @@ class LLMProvider(ABC):
     
     def supports_vision(self) -> bool:
         """Check if the model supports vision capabilities"""
-        model_name = self.get_model_name().lower()
-        vision_models = ['gpt-4o', 'gpt-4-vision', 'claude-3', 'gemini-pro-vision', 'gemini-1.5', 'llava']
-        return any(vision_model in model_name for vision_model in vision_models)
+        if self._supports_vision is None:
+            model_name = self._model_name_lc
+            if model_name is None:
+                model_name = self._model_name_lc = self.get_model_name().lower()
+            self._supports_vision = _vision_ok(model_name)
+        return self._supports_vision
     
     @staticmethod
     def create_provider(provider_type: str, config: Config) -> 'LLMProvider':
-        """Factory method to create LLM providers"""
-        if provider_type.lower() == 'google':
+        """Factory method to create LLM providers
+
+        Instances are cached per (provider type, config), so repeated calls
+        with the same arguments return the same provider.
+        """
+        provider_type = provider_type.lower()
+        cache_key = (provider_type, id(config))
+        provider = _PROVIDER_CACHE.get(cache_key)
+        if provider is not None:
+            return provider
+
+        if provider_type == 'google':
             from .google_provider import GoogleProvider
-            return GoogleProvider(config)
-        elif provider_type.lower() == 'openai':
+            provider = GoogleProvider(config)
+        elif provider_type == 'openai':
             from .openai_provider import OpenAIProvider
-            return OpenAIProvider(config)
-        elif provider_type.lower() == 'groq':
+            provider = OpenAIProvider(config)
+        elif provider_type == 'groq':
             from .groq_provider import GroqProvider
-            return GroqProvider(config)
+            provider = GroqProvider(config)
         else:
-            raise ValueError(f"Unsupported LLM provider: {provider_type}")
\ No newline at end of file
+            raise ValueError(f"Unsupported LLM provider: {provider_type}")
+
+        _PROVIDER_CACHE[cache_key] = provider
+        return provider
+
+    @staticmethod
+    def clear_cache():
+        """Clear cached provider instances (mainly for tests)"""
+        _PROVIDER_CACHE.clear()
\ No newline at end of file
@@ -1,9 +1,27 @@
+import functools
 import os
+import re
 from typing import Dict, Any
 from browser_use.llm import ChatOpenAI
 from .llm_provider import LLMProvider
 from config.config import Config
 
+_FUNCTION_CALLING_RE = re.compile("|".join(map(re.escape, ("gpt-4", "gpt-3.5-turbo"))))
+_VISION_RE = re.compile("|".join(map(re.escape, ("gpt-4o", "gpt-4-vision", "vision"))))
+
+
+@functools.lru_cache(maxsize=32)
+def _supports_function_calling(model_name: str) -> bool:
+    """Check a lowercased OpenAI model name for function-calling support"""
+    return _FUNCTION_CALLING_RE.search(model_name) is not None
+
+
+@functools.lru_cache(maxsize=32)
+def _is_vision_model(model_name: str) -> bool:
+    """Check a lowercased OpenAI model name for vision support"""
+    return _VISION_RE.search(model_name) is not None
+
+
 class OpenAIProvider(LLMProvider):
     """OpenAI LLM provider for browser-use integration"""
     
@@ -12,8 +30,18 @@ class OpenAIProvider(LLMProvider):
         self.base_url = config.get("llm.openai.base_url") # For custom endpoints
         self.api_key = config.get("llm.openai.api_key") or os.getenv("OPENAI_API_KEY")
         self.model_name = config.get("llm.openai.model", "openai/gpt-oss-120b")
+        self._model_name_lc = self.model_name.lower()
         self.temperature = config.get("llm.openai.temperature", 0.1)
-        
+        # Resolve capability flags and the info dict once up front
+        self._model_info = {
+            "provider": "openai",
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "supports_vision": self.supports_vision(),
+            "api_key_configured": bool(self.api_key),
+            "base_url": self.base_url
+        }
+
     def get_llm(self):
         """Return ChatOpenAI instance compatible with browser-use Agent"""
         if self._llm is None:
@@ -49,14 +77,7 @@ class OpenAIProvider(LLMProvider):
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get OpenAI model information"""
-        return {
-            "provider": "openai",
-            "model": self.model_name,
-            "temperature": self.temperature,
-            "supports_vision": self.supports_vision(),
-            "api_key_configured": bool(self.api_key),
-            "base_url": self.base_url
-        }
+        return self._model_info
     
     def get_model_name(self) -> str:
         """Get the model name/identifier"""
@@ -65,10 +86,8 @@ class OpenAIProvider(LLMProvider):
     def supports_function_calling(self) -> bool:
         """Check if the model supports function calling"""
         # GPT-4 and GPT-3.5-turbo models support function calling
-        function_calling_models = ["gpt-4", "gpt-3.5-turbo"]
-        return any(model in self.model_name.lower() for model in function_calling_models)
-    
+        return _supports_function_calling(self._model_name_lc)
+
     def is_vision_model(self) -> bool:
         """Check if this is specifically a vision-enabled model"""
-        vision_indicators = ["gpt-4o", "gpt-4-vision", "vision"]
-        return any(indicator in self.model_name.lower() for indicator in vision_indicators)
\ No newline at end of file
+        return _is_vision_model(self._model_name_lc)
\ No newline at end of file
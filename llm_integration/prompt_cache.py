@@ -0,0 +1,78 @@
+"""Prompt/response caching for repeated deterministic LLM calls"""
+
+import asyncio
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class PromptCache:
+    """Disk-backed cache of prompt -> response pairs
+
+    Suites re-send the same prompts verbatim on every run; caching the
+    responses skips the token cost and latency for repeats. Only
+    deterministic requests (temperature == 0) are stored — sampled
+    output must not be replayed as if it were stable.
+    """
+
+    def __init__(self, cache_dir: str = ".cache/llm"):
+        self._cache_dir = Path(cache_dir)
+        self._memory: Dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, messages: Any, temperature: float = 0.0) -> str:
+        """Build a stable cache key from the full request shape"""
+        payload = json.dumps(
+            {"model": model, "messages": messages, "temperature": temperature},
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for key, or None on a miss"""
+        value = self._memory.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        value = await asyncio.to_thread(self._read, key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._memory[key] = value
+        return value
+
+    async def set(self, key: str, value: Any, temperature: float = 0.0) -> None:
+        """Store a response; sampled (temperature > 0) output is skipped"""
+        if temperature != 0:
+            return
+        self._memory[key] = value
+        await asyncio.to_thread(self._write, key, value)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for summary output"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def _path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[Any]:
+        try:
+            return json.loads(self._path(key).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, value: Any) -> None:
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            self._path(key).write_text(json.dumps(value, default=str), encoding='utf-8')
+        except OSError:
+            pass
@@ -7,8 +7,8 @@ separate Python scripts for each test suite. The core engine handles all
 configurations and test types based on the YAML file.
 """
 
-import asyncio
 import argparse
+import os
 import sys
 from pathlib import Path
 from typing import Optional
@@ -19,8 +19,9 @@ sys.path.insert(0, str(project_root))
 
 from config import Config
 from config.yaml_loader import YAMLLoader
-from test_engine.test_engine import TestEngine
-from test_engine.result_collector import ResultCollector
+
+# TestEngine (and asyncio) are imported inside the run path only; they pull
+# in browser-use and the LLM SDKs, which list/validate/template never need.
 
 
 def print_banner():
@@ -31,33 +32,34 @@ def print_banner():
     print("="*80 + "\n")
 
 
-def validate_yaml_file(file_path: str) -> bool:
+def validate_yaml_file(file_path: str) -> Optional['TestSuite']:
     """Validate that the YAML file exists and is valid
-    
+
     Args:
         file_path: Path to YAML file
-        
+
     Returns:
-        True if valid, False otherwise
+        The loaded TestSuite if valid, None otherwise; callers can run
+        the returned suite directly instead of parsing the file again
     """
     try:
         path = Path(file_path)
         if not path.exists():
             print(f"❌ Error: Test suite file not found: {file_path}")
-            return False
-            
+            return None
+
         if not path.suffix.lower() in ['.yaml', '.yml']:
             print(f"❌ Error: File must be a YAML file (.yaml or .yml): {file_path}")
-            return False
-            
+            return None
+
         # Try to load and validate the YAML
-        YAMLLoader.load_test_suite(file_path)
+        test_suite = YAMLLoader.load_test_suite(file_path)
         print(f"✅ YAML file validated: {file_path}")
-        return True
-        
+        return test_suite
+
     except Exception as e:
         print(f"❌ Error validating YAML file: {e}")
-        return False
+        return None
 
 
 def list_available_test_suites():
@@ -73,50 +75,58 @@ def list_available_test_suites():
     
     for env_dir in ["examples", "staging", "production"]:
         env_path = test_suites_dir / env_dir
-        if env_path.exists():
-            yaml_files = list(env_path.glob("*.yaml")) + list(env_path.glob("*.yml"))
-            if yaml_files:
-                print(f"   📁 {env_dir.upper()}:")
-                for yaml_file in sorted(yaml_files):
-                    rel_path = yaml_file.relative_to(project_root)
-                    print(f"      • {rel_path}")
-                print()
-                found_suites = True
+        if not env_path.is_dir():
+            continue
+        # One scandir pass; glob would stat every entry twice over
+        with os.scandir(env_path) as entries:
+            yaml_files = sorted(
+                entry.path for entry in entries
+                if entry.is_file(follow_symlinks=False) and entry.name.endswith(('.yaml', '.yml'))
+            )
+        if yaml_files:
+            lines = [f"   📁 {env_dir.upper()}:"]
+            lines.extend(
+                f"      • {Path(yaml_file).relative_to(project_root)}"
+                for yaml_file in yaml_files
+            )
+            lines.append("")
+            print("\n".join(lines))
+            found_suites = True
     
     if not found_suites:
         print("   No YAML test suites found.")
 
 
-async def run_test_suite(yaml_file: str, config_overrides: Optional[dict] = None):
-    """Run a test suite from YAML file
-    
+async def run_test_suite(test_suite, yaml_file: str, config_overrides: Optional[dict] = None):
+    """Run an already-loaded test suite
+
     Args:
-        yaml_file: Path to YAML test suite file
+        test_suite: TestSuite parsed by validate_yaml_file
+        yaml_file: Path to the source YAML file (used for report naming)
         config_overrides: Optional configuration overrides
     """
     try:
         print(f"🔧 Initializing configuration...")
         config = Config()
-        
+
         # Apply any configuration overrides
         if config_overrides:
             for key, value in config_overrides.items():
                 config.set(key, value)
-        
-        print(f"📋 Loading test suite: {yaml_file}")
-        test_suite = YAMLLoader.load_test_suite(yaml_file)
-        
+
         # Set base_url from test suite into config if not already set
         if test_suite.base_url and not config.get("base_url"):
             config.set("base_url", test_suite.base_url)
             print(f"🔗 Set base URL from test suite: {test_suite.base_url}")
         
-        # Set LLM provider from test suite if specified
-        if test_suite.default_llm_provider and not config_overrides.get("llm.provider") if config_overrides else True:
+        # Set LLM provider from test suite unless overridden on the CLI
+        provider_override = (config_overrides or {}).get("llm.provider")
+        if test_suite.default_llm_provider and not provider_override:
             config.set("llm.provider", test_suite.default_llm_provider)
             print(f"🧠 Set LLM provider from test suite: {test_suite.default_llm_provider}")
         
         print(f"⚙️ Initializing test engine...")
+        from test_engine.test_engine import TestEngine
         test_engine = TestEngine(config)
         
         # Display test suite overview
@@ -129,10 +139,12 @@ async def run_test_suite(yaml_file: str, config_overrides: Optional[dict] = None
         if test_suite.parallel:
             print(f"   Max Workers: {test_suite.max_workers}")
         
+        # One print per block rather than per line; stdout is line-buffered
         print("\n🧪 TESTS TO EXECUTE:")
-        for i, test in enumerate(test_suite.tests, 1):
-            tags_str = ", ".join(test.tags) if test.tags else "no tags"
-            print(f"   {i:2d}. {test.name} ({tags_str})")
+        print("\n".join(
+            f"   {i:2d}. {test.name} ({', '.join(test.tags) if test.tags else 'no tags'})"
+            for i, test in enumerate(test_suite.tests, 1)
+        ))
         
         print("\n🚀 Starting test execution...")
         print("-" * 80)
@@ -147,57 +159,62 @@ async def run_test_suite(yaml_file: str, config_overrides: Optional[dict] = None
         # Get result collector from test engine
         result_collector = test_engine.result_collector
         
-        # Create reports directory
+        # Create reports directory and resolve both paths up front
         from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_dir = Path("reports")
         report_dir.mkdir(exist_ok=True)
-        
+
         # Generate base filename from test suite name
         base_name = Path(yaml_file).stem
-        
-        # Generate HTML report
         html_report_path = report_dir / f"{base_name}_report_{timestamp}.html"
-        html_path = result_collector.export_to_html(str(html_report_path))
-        print(f"   📄 HTML report: {html_path}")
-        
-        # Generate Markdown report
         md_report_path = report_dir / f"{base_name}_report_{timestamp}.md"
-        md_path = result_collector.export_to_markdown(str(md_report_path))
+
+        # Render and write both formats concurrently; each releases the
+        # GIL during file I/O
+        import asyncio
+        html_path, md_path = await asyncio.gather(
+            asyncio.to_thread(result_collector.export_to_html, str(html_report_path)),
+            asyncio.to_thread(result_collector.export_to_markdown, str(md_report_path)),
+        )
+        print(f"   📄 HTML report: {html_path}")
         print(f"   📄 Markdown report: {md_path}")
         
-        # Display results summary
+        # Display results summary; bind the lookups once and reuse them
+        # for both the printout and the exit-code decision
+        stats = summary.get('statistics') or {}
+        total_tests = stats.get('total_tests', 0)
+        passed_count = stats.get('passed', 0)
+        failed_count = stats.get('failed', 0)
+        error_count = stats.get('errors', 0)
+        duration = summary.get('total_duration', 0)
+
         print("\n📊 EXECUTION SUMMARY:")
         print("-" * 80)
-        stats = summary.get('statistics', {})
-        print(f"   Total Tests: {stats.get('total_tests', 0)}")
-        print(f"   Passed: {stats.get('passed', 0)}")
-        print(f"   Failed: {stats.get('failed', 0)}")
-        print(f"   Errors: {stats.get('errors', 0)}")
-        print(f"   Duration: {summary.get('total_duration', 0):.2f} seconds")
-        
-        if summary.get('llm_info'):
-            llm_info = summary['llm_info']
+        print(f"   Total Tests: {total_tests}")
+        print(f"   Passed: {passed_count}")
+        print(f"   Failed: {failed_count}")
+        print(f"   Errors: {error_count}")
+        print(f"   Duration: {duration:.2f} seconds")
+
+        llm_info = summary.get('llm_info')
+        if llm_info:
             print(f"   LLM Provider: {llm_info.get('provider', 'Unknown')}")
             print(f"   Model: {llm_info.get('model', 'Unknown')}")
-        
+
         print(f"\n📁 Reports saved to: {report_dir.absolute()}")
-        
+
         # Cleanup
         await test_engine.cleanup()
-        
+
         # Return appropriate exit code
-        stats = summary.get('statistics', {})
-        failed_count = stats.get('failed', 0)
-        error_count = stats.get('errors', 0)
-        
-        if failed_count > 0 or error_count > 0:
-            if failed_count > 0 and error_count > 0:
-                print(f"\n❌ {failed_count} tests failed and {error_count} tests had errors.")
-            elif failed_count > 0:
-                print(f"\n❌ {failed_count} tests failed.")
-            else:
-                print(f"\n❌ {error_count} tests had errors.")
+        if failed_count or error_count:
+            parts = []
+            if failed_count:
+                parts.append(f"{failed_count} tests failed")
+            if error_count:
+                parts.append(f"{error_count} tests had errors")
+            print(f"\n❌ {' and '.join(parts)}.")
             return 1
         else:
             print("\n✅ All tests passed!")
@@ -222,53 +239,80 @@ def create_template(output_file: str):
         print(f"❌ Error creating template: {e}")
 
 
+_USAGE = """usage: main.py {run,list,validate,template} ...
+
+BrowserTest AI - Universal Test Suite Runner
+
+Available commands:
+  run        Run a test suite
+  list       List available test suites
+  validate   Validate a YAML test suite
+  template   Create a template test suite
+
+Examples:
+  main.py run test_suites/examples/example_test_suite.yaml
+  main.py run test_suites/production/mrgb_blog_test_suite.yaml --parallel
+  main.py list
+  main.py validate test_suites/examples/example_test_suite.yaml
+  main.py template --output my_test_suite.yaml
+"""
+
+
+def _build_run_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='main.py run', description='Run a test suite')
+    parser.add_argument('yaml_file', help='Path to YAML test suite file')
+    parser.add_argument('--parallel', action='store_true', help='Force parallel execution')
+    parser.add_argument('--sequential', action='store_true', help='Force sequential execution')
+    parser.add_argument('--workers', type=int, help='Number of parallel workers')
+    parser.add_argument('--llm-provider', choices=['google', 'openai', 'groq'], help='LLM provider to use')
+    parser.add_argument('--browser', choices=['chrome', 'firefox', 'webkit', 'edge'], help='Browser to use')
+    parser.add_argument('--headless', action='store_true', help='Run in headless mode')
+    return parser
+
+
+def _build_list_parser() -> argparse.ArgumentParser:
+    return argparse.ArgumentParser(prog='main.py list', description='List available test suites')
+
+
+def _build_validate_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='main.py validate', description='Validate a YAML test suite')
+    parser.add_argument('yaml_file', help='Path to YAML test suite file')
+    return parser
+
+
+def _build_template_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='main.py template', description='Create a template test suite')
+    parser.add_argument('--output', '-o', default='template_test_suite.yaml', help='Output file path')
+    return parser
+
+
+# Parsers are built on demand: each invocation constructs only the one
+# subcommand tree it actually dispatches to
+COMMANDS = {
+    'run': _build_run_parser,
+    'list': _build_list_parser,
+    'validate': _build_validate_parser,
+    'template': _build_template_parser,
+}
+
+
 def main():
     """Main CLI entry point"""
-    parser = argparse.ArgumentParser(
-        description="BrowserTest AI - Universal Test Suite Runner",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s run test_suites/examples/example_test_suite.yaml
-  %(prog)s run test_suites/production/mrgb_blog_test_suite.yaml --parallel
-  %(prog)s list
-  %(prog)s validate test_suites/examples/example_test_suite.yaml
-  %(prog)s template --output my_test_suite.yaml
-        """
-    )
-    
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Run command
-    run_parser = subparsers.add_parser('run', help='Run a test suite')
-    run_parser.add_argument('yaml_file', help='Path to YAML test suite file')
-    run_parser.add_argument('--parallel', action='store_true', help='Force parallel execution')
-    run_parser.add_argument('--sequential', action='store_true', help='Force sequential execution')
-    run_parser.add_argument('--workers', type=int, help='Number of parallel workers')
-    run_parser.add_argument('--llm-provider', choices=['google', 'openai', 'groq'], help='LLM provider to use')
-    run_parser.add_argument('--browser', choices=['chrome', 'firefox', 'webkit', 'edge'], help='Browser to use')
-    run_parser.add_argument('--headless', action='store_true', help='Run in headless mode')
-    
-    # List command
-    list_parser = subparsers.add_parser('list', help='List available test suites')
-    
-    # Validate command
-    validate_parser = subparsers.add_parser('validate', help='Validate a YAML test suite')
-    validate_parser.add_argument('yaml_file', help='Path to YAML test suite file')
-    
-    # Template command
-    template_parser = subparsers.add_parser('template', help='Create a template test suite')
-    template_parser.add_argument('--output', '-o', default='template_test_suite.yaml', help='Output file path')
-    
-    args = parser.parse_args()
-    
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command not in COMMANDS:
+        print(_USAGE)
+        return 0 if command in ('-h', '--help') else 1
+
+    args = COMMANDS[command]().parse_args(sys.argv[2:])
+
     print_banner()
-    
-    if args.command == 'run':
-        # Validate YAML file first
-        if not validate_yaml_file(args.yaml_file):
+
+    if command == 'run':
+        # Validate YAML file first; the parsed suite is reused for the run
+        test_suite = validate_yaml_file(args.yaml_file)
+        if test_suite is None:
             return 1
-        
+
         # Prepare configuration overrides
         config_overrides = {}
         if args.llm_provider:
@@ -285,26 +329,28 @@ Examples:
             config_overrides['test.parallel'] = False
         
         # Run the test suite
-        return asyncio.run(run_test_suite(args.yaml_file, config_overrides))
+        import asyncio
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+        return asyncio.run(run_test_suite(test_suite, args.yaml_file, config_overrides))
         
-    elif args.command == 'list':
+    elif command == 'list':
         list_available_test_suites()
         return 0
-        
-    elif args.command == 'validate':
-        if validate_yaml_file(args.yaml_file):
+
+    elif command == 'validate':
+        if validate_yaml_file(args.yaml_file) is not None:
             print("✅ YAML file is valid!")
             return 0
         else:
             return 1
-            
-    elif args.command == 'template':
+
+    elif command == 'template':
         create_template(args.output)
         return 0
-        
-    else:
-        parser.print_help()
-        return 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,28 @@
+"""Parallel import warm-up for the runner scripts
+
+playwright.async_api and browser_use each take a noticeable fraction of
+a second to import; importing them on worker threads overlaps their
+module initialization (the GIL is released during file I/O), so the
+scripts' own top-level imports then hit warm sys.modules entries.
+"""
+
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+_HEAVY_MODULES = ("playwright.async_api", "browser_use")
+
+
+def warm_imports():
+    """Import the heavy third-party modules on worker threads
+
+    Failures are ignored here; the script's own imports will raise a
+    proper ImportError if a dependency is genuinely missing.
+    """
+    def _import(name):
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+    with ThreadPoolExecutor(max_workers=len(_HEAVY_MODULES)) as executor:
+        list(executor.map(_import, _HEAVY_MODULES))
@@ -17,96 +17,102 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Warm the heavy third-party imports on threads before pulling them in
+from _warmup import warm_imports
+warm_imports()
+
 from browser_use import Agent, BrowserSession
-from browser_use.llm import ChatOpenAI
 from playwright.async_api import async_playwright
 from config.config import Config
 from llm_integration.llm_provider import LLMProvider
 
+# Prefer uvloop's libuv-based loop when installed; the demos are
+# scheduling-heavy (parallel agents over a WebSocket transport)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 
-async def demo_parallel_tabs():
+async def demo_parallel_tabs(playwright, llm):
     """
     Demonstrate parallel execution in multiple tabs of the same browser.
     This is ideal for independent tasks that don't interfere with each other.
     """
     print("🚀 Demo: Parallel Agents in Multiple Tabs")
     print("="*50)
-    
-    async with async_playwright() as playwright:
-        # Launch browser with persistent context
-        browser_context = await playwright.chromium.launch_persistent_context(
-            user_data_dir=None,  # Use temporary directory
-            headless=False,
-            viewport={'width': 1920, 'height': 1080}
-        )
-        
-        # Create multiple pages (tabs)
-        page1 = await browser_context.new_page()
-        page2 = await browser_context.new_page()
-        page3 = await browser_context.new_page()
-        
-        print(f"📱 Created 3 tabs in the same browser")
-        
-        # Initialize LLM (you'll need to set up your API key)
-        config = Config()
-        llm_provider = LLMProvider.create_provider(config)
-        llm = await llm_provider.get_llm()
-        
-        # Create agents for each tab with different tasks
-        agent1 = Agent(
-            task="Navigate to https://mrgb.in and describe what you see on the homepage. Focus on the main heading, description, and navigation elements.",
-            llm=llm,
-            page=page1,
-        )
-        
-        agent2 = Agent(
-            task="Navigate to https://mrgb.in/blog and list all the blog posts you can find. Describe their titles and any visible content.",
-            llm=llm,
-            page=page2,
-        )
-        
-        agent3 = Agent(
-            task="Navigate to https://mrgb.in/work and describe the work experience information displayed on the page.",
-            llm=llm,
-            page=page3,
-        )
-        
-        print("🔄 Running 3 agents in parallel...")
-        
-        # Run all agents in parallel
-        results = await asyncio.gather(
-            agent1.run(),
-            agent2.run(),
-            agent3.run(),
-            return_exceptions=True
-        )
-        
-        # Display results
-        print("\n📊 Results:")
-        print("-" * 30)
-        
-        tasks = ["Homepage Analysis", "Blog Section", "Work Experience"]
-        for i, (task, result) in enumerate(zip(tasks, results)):
-            print(f"\n{i+1}. {task}:")
-            if isinstance(result, Exception):
-                print(f"   ❌ Error: {str(result)}")
-            else:
-                print(f"   ✅ Success: {str(result)[:200]}...")
-        
-        await browser_context.close()
-        print("\n🔒 Browser closed")
 
+    # Launch browser with persistent context
+    browser_context = await playwright.chromium.launch_persistent_context(
+        user_data_dir=None,  # Use temporary directory
+        headless=False,
+        viewport={'width': 1920, 'height': 1080}
+    )
+
+    # Create multiple pages (tabs)
+    page1 = await browser_context.new_page()
+    page2 = await browser_context.new_page()
+    page3 = await browser_context.new_page()
+
+    print(f"📱 Created 3 tabs in the same browser")
+
+    # Create agents for each tab with different tasks
+    agent1 = Agent(
+        task="Navigate to https://mrgb.in and describe what you see on the homepage. Focus on the main heading, description, and navigation elements.",
+        llm=llm,
+        page=page1,
+    )
+
+    agent2 = Agent(
+        task="Navigate to https://mrgb.in/blog and list all the blog posts you can find. Describe their titles and any visible content.",
+        llm=llm,
+        page=page2,
+    )
+
+    agent3 = Agent(
+        task="Navigate to https://mrgb.in/work and describe the work experience information displayed on the page.",
+        llm=llm,
+        page=page3,
+    )
 
-async def demo_sequential_tab_reuse():
+    print("🔄 Running 3 agents in parallel...")
+
+    # Run all agents in parallel
+    results = await asyncio.gather(
+        agent1.run(),
+        agent2.run(),
+        agent3.run(),
+        return_exceptions=True
+    )
+
+    # Display results
+    print("\n📊 Results:")
+    print("-" * 30)
+
+    tasks = ["Homepage Analysis", "Blog Section", "Work Experience"]
+    for i, (task, result) in enumerate(zip(tasks, results)):
+        print(f"\n{i+1}. {task}:")
+        if isinstance(result, Exception):
+            print(f"   ❌ Error: {str(result)}")
+        else:
+            print(f"   ✅ Success: {str(result)[:200]}...")
+
+    await browser_context.close()
+    print("\n🔒 Browser closed")
+
+
+async def demo_sequential_tab_reuse(playwright, llm):
     """
     Demonstrate sequential execution with tab reuse.
     This approach is more resource-efficient for related tasks.
     """
     print("\n🔄 Demo: Sequential Execution with Tab Reuse")
     print("="*50)
-    
-    # Create a reusable browser session
+
+    # Create a reusable browser session on the shared driver
     browser_session = BrowserSession(
+        playwright=playwright,
         headless=False,
         viewport={'width': 1920, 'height': 1080},
         keep_alive=True  # Keep browser alive between tasks
@@ -115,12 +121,7 @@ async def demo_sequential_tab_reuse():
     try:
         await browser_session.start()
         print("📱 Browser session started")
-        
-        # Initialize LLM
-        config = Config()
-        llm_provider = LLMProvider.create_provider(config)
-        llm = await llm_provider.get_llm()
-        
+
         # Sequential tasks that build on each other
         tasks = [
             {
@@ -173,15 +174,16 @@ async def demo_sequential_tab_reuse():
         print("\n🔒 Browser session closed")
 
 
-async def demo_tab_management():
+async def demo_tab_management(playwright):
     """
     Demonstrate advanced tab management capabilities.
     Shows how to create, switch between, and manage multiple tabs.
     """
     print("\n🗂️  Demo: Advanced Tab Management")
     print("="*50)
-    
+
     browser_session = BrowserSession(
+        playwright=playwright,
         headless=False,
         keep_alive=True
     )
@@ -206,14 +208,13 @@ async def demo_tab_management():
             tabs.append(page)
             print(f"📄 Tab {i+1}: Opened {url}")
         
-        # Demonstrate tab switching and information gathering
+        # Demonstrate tab switching and information gathering; the title
+        # round-trips don't need the tab activated, so issue them together
         print("\n🔍 Gathering information from all tabs:")
-        
-        for i, page in enumerate(tabs):
-            await page.bring_to_front()
-            title = await page.title()
-            url = page.url
-            print(f"   Tab {i+1}: '{title}' at {url}")
+
+        titles = await asyncio.gather(*(page.title() for page in tabs))
+        for i, (page, title) in enumerate(zip(tabs, titles)):
+            print(f"   Tab {i+1}: '{title}' at {page.url}")
         
         # Close specific tabs
         print("\n🗑️  Closing blog and work tabs, keeping homepage...")
@@ -238,14 +239,23 @@ async def main():
     print("=" * 60)
     
     try:
-        # Demo 1: Parallel execution in multiple tabs
-        await demo_parallel_tabs()
-        
-        # Demo 2: Sequential execution with tab reuse
-        await demo_sequential_tab_reuse()
-        
-        # Demo 3: Advanced tab management
-        await demo_tab_management()
+        # One Playwright driver process serves every demo; starting it per
+        # demo would pay the cold start three times
+        async with async_playwright() as playwright:
+            # Build the LLM client once; every demo shares the same HTTP
+            # session instead of paying setup per demo
+            config = Config()
+            provider = LLMProvider.create_provider(config.get("llm.provider", "google"), config)
+            llm = provider.llm
+
+            # Demo 1: Parallel execution in multiple tabs
+            await demo_parallel_tabs(playwright, llm)
+
+            # Demo 2: Sequential execution with tab reuse
+            await demo_sequential_tab_reuse(playwright, llm)
+
+            # Demo 3: Advanced tab management
+            await demo_tab_management(playwright)
         
         print("\n🎉 All demonstrations completed successfully!")
         print("\n💡 Key Takeaways:")
@@ -263,5 +273,7 @@ async def main():
 if __name__ == "__main__":
     print("⚠️  Note: Make sure you have set up your LLM API key (GOOGLE_API_KEY or OPENAI_API_KEY)")
     print("   This demo will open a browser and navigate to https://mrgb.in\n")
-    
-    asyncio.run(main())
\ No newline at end of file
+
+    # Runner reuses one event loop instead of building one per asyncio.run
+    with asyncio.Runner() as runner:
+        runner.run(main())
\ No newline at end of file
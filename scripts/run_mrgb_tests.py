@@ -8,6 +8,10 @@ within the same browser instance for efficient testing.
 """
 
 import asyncio
+import json
+import logging
+import logging.handlers
+import queue
 import sys
 import os
 from pathlib import Path
@@ -17,14 +21,34 @@ from typing import List, Dict, Any
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Warm the heavy third-party imports on threads before pulling them in
+from _warmup import warm_imports
+warm_imports()
+
 from config.config import Config
-from config.yaml_loader import YAMLLoader
+from config.yaml_loader import YAMLLoader, TestSuite, TestCase
 from llm_integration.llm_provider import LLMProvider
-from llm_integration.browser_use_integration import BrowserUseIntegration
+from llm_integration.browser_use_integration import BrowserUseIntegration, PROMPT_CACHE
+from llm_integration.prompt_cache import PromptCache
 from test_engine.test_engine import TestEngine
 from test_engine.result_collector import ResultCollector
 from browser_use import BrowserSession, Agent
-from playwright.async_api import async_playwright
+from browser_manager.playwright_singleton import get_playwright, stop_playwright
+
+# Per-test progress goes through a queue so the event loop never blocks
+# on terminal writes; a QueueListener thread drains it to stdout
+logger = logging.getLogger("mrgb_tests")
+
+
+def _setup_logging() -> logging.handlers.QueueListener:
+    """Route test logging through a queue and return the drain thread"""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    return listener
 
 
 class MRGBTestRunner:
@@ -32,46 +56,72 @@ class MRGBTestRunner:
     
     def __init__(self, config_path: str = None):
         self.config = Config(config_path)
-        self.llm_provider = LLMProvider.create_provider(self.config)
+        self.llm_provider = LLMProvider.create_provider(
+            self.config.get("llm.provider", "google"), self.config
+        )
         self.browser_integration = BrowserUseIntegration(self.config, self.llm_provider)
         self.result_collector = ResultCollector()
-        
-    async def run_multi_tab_tests(self, test_suite_path: str) -> Dict[str, Any]:
+        self._llm = None
+        # Replaying cached results is only sound for deterministic runs;
+        # gate on the temperature the provider actually uses (each reads
+        # its own llm.<provider>.temperature key), not a separate setting
+        model_info = self.llm_provider.get_model_info()
+        self._llm_temperature = model_info.get("temperature", 0.1)
+        self._model_name = model_info.get("model")
+        # Contexts opened during a run, closed in run_multi_tab_tests'
+        # finally block so a kept-alive session does not leak them
+        self._opened_contexts: List[Any] = []
+
+    async def _get_llm(self):
+        """Return the shared LLM client, building it on first use"""
+        if self._llm is None:
+            self._llm = self.llm_provider.get_llm()
+        return self._llm
+
+    async def run_multi_tab_tests(self, test_suite_path: str, close_on_exit: bool = True) -> Dict[str, Any]:
         """
         Run tests with multiple tabs in the same browser instance.
         This demonstrates the browser-use library's capability to handle
         multiple tabs efficiently.
+
+        Pass close_on_exit=False to keep the browser session alive after
+        the run (e.g. to run several suites against one warm browser);
+        per-run contexts are still closed either way.
         """
         print(f"Loading test suite: {test_suite_path}")
         
-        # Load test suite configuration
-        yaml_loader = YAMLLoader()
-        test_suite = yaml_loader.load_test_suite(test_suite_path)
+        # Load test suite configuration through the on-disk cache
+        test_suite = YAMLLoader.load_test_suite_cached(test_suite_path)
         
-        print(f"Test Suite: {test_suite['name']}")
-        print(f"Description: {test_suite['description']}")
-        print(f"Base URL: {test_suite['base_url']}")
-        print(f"Number of tests: {len(test_suite['tests'])}")
+        print(f"Test Suite: {test_suite.name}")
+        print(f"Description: {test_suite.description}")
+        print(f"Base URL: {test_suite.base_url}")
+        print(f"Number of tests: {len(test_suite.tests)}")
         print("\n" + "="*60 + "\n")
-        
-        # Initialize browser session with keep_alive for multi-tab support
+
+        # Initialize browser session with keep_alive for multi-tab support,
+        # on the shared Playwright driver so repeat runs skip driver startup
         browser_session = BrowserSession(
-            headless=test_suite.get('default_browser', {}).get('headless', False),
-            viewport=test_suite.get('default_browser', {}).get('viewport', {'width': 1920, 'height': 1080}),
+            playwright=await get_playwright(),
+            headless=test_suite.default_browser.headless,
+            viewport=test_suite.default_browser.viewport,
             keep_alive=True  # Keep browser alive for multiple tabs
         )
         
         try:
             await browser_session.start()
             print("✅ Browser session started successfully")
-            
+
+            # Resolve the LLM once so per-test agent setup is pure CPU
+            await self._get_llm()
+
             # Run setup if specified
-            if 'setup_prompt' in test_suite:
+            if test_suite.setup_prompt:
                 print("🔧 Running setup...")
-                await self._run_setup(browser_session, test_suite['setup_prompt'], test_suite['base_url'])
-            
+                await self._run_setup(browser_session, test_suite.setup_prompt, test_suite.base_url)
+
             # Determine execution strategy
-            if test_suite.get('parallel', False):
+            if test_suite.parallel:
                 print("🚀 Running tests in parallel with multiple tabs")
                 results = await self._run_parallel_tests(browser_session, test_suite)
             else:
@@ -79,19 +129,30 @@ class MRGBTestRunner:
                 results = await self._run_sequential_tests(browser_session, test_suite)
             
             # Run teardown if specified
-            if 'teardown_prompt' in test_suite:
+            if test_suite.teardown_prompt:
                 print("🧹 Running teardown...")
-                await self._run_teardown(browser_session, test_suite['teardown_prompt'])
+                await self._run_teardown(browser_session, test_suite.teardown_prompt)
             
             return results
             
         finally:
-            await browser_session.close()
-            print("🔒 Browser session closed")
+            # Always close per-run contexts; only tear the session down
+            # when the caller has not asked to keep it warm
+            for context in self._opened_contexts:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+            self._opened_contexts.clear()
+            if close_on_exit:
+                await browser_session.close()
+                print("🔒 Browser session closed")
+            else:
+                print("🔥 Browser session kept alive for reuse")
     
     async def _run_setup(self, browser_session: BrowserSession, setup_prompt: str, base_url: str):
         """Run setup tasks"""
-        llm = await self.llm_provider.get_llm()
+        llm = await self._get_llm()
         agent = Agent(
             task=setup_prompt,
             llm=llm,
@@ -107,7 +168,7 @@ class MRGBTestRunner:
     
     async def _run_teardown(self, browser_session: BrowserSession, teardown_prompt: str):
         """Run teardown tasks"""
-        llm = await self.llm_provider.get_llm()
+        llm = await self._get_llm()
         agent = Agent(
             task=teardown_prompt,
             llm=llm,
@@ -116,106 +177,265 @@ class MRGBTestRunner:
         result = await agent.run()
         print(f"   Teardown completed: {result}")
     
-    async def _run_parallel_tests(self, browser_session: BrowserSession, test_suite: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _run_parallel_tests(self, browser_session: BrowserSession, test_suite: TestSuite) -> List[Dict[str, Any]]:
         """
         Run tests in parallel using multiple tabs.
         Each test gets its own tab in the same browser instance.
         """
-        tests = test_suite['tests']
-        base_url = test_suite['base_url']
-        
-        # Create agents for parallel execution
-        agents = []
-        for test in tests:
-            # Create a new page (tab) for each test
-            new_page = await browser_session.browser_context.new_page()
-            
-            # Navigate to the test URL
-            test_url = base_url + test.get('url', '/')
-            await new_page.goto(test_url)
-            
-            # Create agent with the specific page
-            llm = await self.llm_provider.get_llm()
-            agent = Agent(
-                task=test['prompt'],
-                llm=llm,
-                page=new_page
-            )
-            
-            agents.append((agent, test))
-        
+        tests = test_suite.tests
+        base_url = test_suite.base_url
+        viewport = test_suite.default_browser.viewport
+
+        # One isolated context per test: contexts are far cheaper than
+        # browsers, keep cookies/storage from leaking between agents, and
+        # let Chromium schedule each on its own renderer process
+        llm = await self._get_llm()
+
+        # Unbounded fan-out thrashes Chromium's renderer pool and ends up
+        # slower than sequential; cap in-flight work at max_workers
+        max_parallel = test_suite.max_workers
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def _prepare(test):
+            """Open an isolated context and navigate it for one test"""
+            async with semaphore:
+                context = await browser_session.browser.new_context(viewport=viewport)
+                self._opened_contexts.append(context)
+                page = await context.new_page()
+                await page.goto(base_url + (test.url or '/'))
+                return Agent(task=test.prompt, llm=llm, page=page), test
+
+        async def _bounded(agent, test):
+            async with semaphore:
+                return await self._execute_test_with_agent(agent, test)
+
+        # Overlap the per-test navigations instead of serializing them;
+        # the contexts opened here are closed by run_multi_tab_tests
+        agents = await asyncio.gather(*[_prepare(test) for test in tests])
+
         # Run all agents in parallel
-        print(f"🔄 Executing {len(agents)} tests in parallel...")
-        tasks = [self._execute_test_with_agent(agent, test) for agent, test in agents]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
+        print(f"🔄 Executing {len(agents)} tests in parallel (max {max_parallel} at once)...")
+        tasks = [_bounded(agent, test) for agent, test in agents]
+
+        # Surface each result as soon as it finishes instead of
+        # blocking the summary on the slowest test
+        results = []
+        for finished in asyncio.as_completed(tasks):
+            try:
+                result = await finished
+            except Exception as exc:
+                result = exc
+            results.append(result)
+            print(f"   📬 {len(results)}/{len(tasks)} tests completed")
+
         return results
     
-    async def _run_sequential_tests(self, browser_session: BrowserSession, test_suite: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _run_sequential_tests(self, browser_session: BrowserSession, test_suite: TestSuite) -> List[Dict[str, Any]]:
         """
         Run tests sequentially, reusing tabs when possible.
         This approach is more resource-efficient for smaller test suites.
         """
-        tests = test_suite['tests']
-        base_url = test_suite['base_url']
+        tests = test_suite.tests
+        base_url = test_suite.base_url
         results = []
-        
+
+        # Opt-in batching: fold runs of simple tests into one agent task
+        # so a group of checks costs a single LLM round-trip
+        if test_suite.batch_prompts:
+            return await self._run_batched_tests(browser_session, test_suite)
+
         for i, test in enumerate(tests):
-            print(f"\n📝 Running test {i+1}/{len(tests)}: {test['name']}")
-            
-            # For sequential tests, we can reuse the main page or create new tabs as needed
-            if test.get('tags', []) and 'multi-tab' in test['tags']:
-                # For multi-tab tests, create a new tab
-                new_page = await browser_session.browser_context.new_page()
-                test_url = base_url + test.get('url', '/')
+            print(f"\n📝 Running test {i+1}/{len(tests)}: {test.name}")
+
+            # For sequential tests, we can reuse the main page or create
+            # an isolated context as needed
+            context = None
+            if 'multi-tab' in test.tags:
+                # For multi-tab tests, create a dedicated context
+                context = await browser_session.browser.new_context()
+                new_page = await context.new_page()
+                test_url = base_url + (test.url or '/')
                 await new_page.goto(test_url)
-                
-                llm = await self.llm_provider.get_llm()
+
+                llm = await self._get_llm()
                 agent = Agent(
-                    task=test['prompt'],
+                    task=test.prompt,
                     llm=llm,
                     page=new_page
                 )
             else:
-                # Use the main browser session
-                test_url = base_url + test.get('url', '/')
+                # Use the main browser session; skip the navigation when
+                # the page is already live on the test's URL (agents may
+                # have navigated away during the previous test), unless
+                # the test is tagged as needing a fresh load
+                test_url = base_url + (test.url or '/')
                 page = await browser_session.get_current_page()
-                await page.goto(test_url)
-                
-                llm = await self.llm_provider.get_llm()
+                fresh = 'requires-fresh' in test.tags
+                if fresh or page.url != test_url:
+                    await page.goto(test_url)
+
+                llm = await self._get_llm()
                 agent = Agent(
-                    task=test['prompt'],
+                    task=test.prompt,
                     llm=llm,
                     browser_session=browser_session
                 )
             
-            result = await self._execute_test_with_agent(agent, test)
+            try:
+                result = await self._execute_test_with_agent(agent, test)
+            finally:
+                if context is not None:
+                    await context.close()
             results.append(result)
-        
+
         return results
     
-    async def _execute_test_with_agent(self, agent: Agent, test: Dict[str, Any]) -> Dict[str, Any]:
+    # Cap on how many tests share one agent task; larger batches make the
+    # combined prompt unwieldy and the JSON answer unreliable
+    _BATCH_SIZE = 8
+
+    async def _run_batched_tests(self, browser_session: BrowserSession, test_suite: TestSuite) -> List[Dict[str, Any]]:
+        """
+        Run tests in batches, combining consecutive simple tests into a
+        single agent task. The agent reports one JSON object per test,
+        which is split back into individual results. Multi-tab tests are
+        never batched and fall through to single-test execution.
+        """
+        tests = test_suite.tests
+        base_url = test_suite.base_url
+        llm = await self._get_llm()
+        results = []
+
+        # Group consecutive non-multi-tab tests into batches
+        batches = []
+        current = []
+        for test in tests:
+            if 'multi-tab' in test.tags:
+                if current:
+                    batches.append(current)
+                    current = []
+                batches.append([test])
+            else:
+                current.append(test)
+                if len(current) >= self._BATCH_SIZE:
+                    batches.append(current)
+                    current = []
+        if current:
+            batches.append(current)
+
+        for batch in batches:
+            if len(batch) == 1:
+                test = batch[0]
+                page = await browser_session.get_current_page()
+                await page.goto(base_url + (test.url or '/'))
+                agent = Agent(task=test.prompt, llm=llm, browser_session=browser_session)
+                results.append(await self._execute_test_with_agent(agent, test))
+                continue
+
+            print(f"\n📦 Running batch of {len(batch)} tests in one agent task")
+            checks = "\n".join(
+                f"{i + 1}. [{test.name}] {test.prompt}"
+                for i, test in enumerate(batch)
+            )
+            task = (
+                "Perform each of the following checks on the site and report "
+                "the outcome of every one. Respond ONLY with a JSON array of "
+                "objects of the form "
+                '{"name": "<check name>", "passed": true/false, "detail": "<short note>"}'
+                f", one per check, in order:\n{checks}"
+            )
+            page = await browser_session.get_current_page()
+            await page.goto(base_url + (batch[0].url or '/'))
+            agent = Agent(task=task, llm=llm, browser_session=browser_session)
+
+            try:
+                raw = await agent.run()
+                results.extend(self._split_batch_result(batch, raw))
+            except Exception as e:
+                print(f"   ❌ Batch failed - {str(e)}")
+                for test in batch:
+                    results.append({
+                        'name': test.name,
+                        'status': 'failed',
+                        'error': f"Batch execution failed: {str(e)}",
+                        'description': test.description,
+                        'tags': list(test.tags),
+                        'success_criteria': test.success_criteria
+                    })
+
+        return results
+
+    def _split_batch_result(self, batch: List[TestCase], raw: Any) -> List[Dict[str, Any]]:
+        """Map a batched agent answer back onto per-test results"""
+        text = str(raw)
+        reported = {}
+        try:
+            start, end = text.index('['), text.rindex(']') + 1
+            for entry in json.loads(text[start:end]):
+                reported[entry.get('name')] = entry
+        except (ValueError, TypeError):
+            pass
+
+        results = []
+        for test in batch:
+            entry = reported.get(test.name)
+            if entry is None:
+                status, extra = 'error', {'error': 'No result reported for this test in the batch answer'}
+            elif entry.get('passed'):
+                status, extra = 'passed', {'result': entry.get('detail', '')}
+            else:
+                status, extra = 'failed', {'error': entry.get('detail', 'Check reported as failed')}
+
+            icon = '✅' if status == 'passed' else '❌'
+            print(f"   {icon} {test.name}: {status.upper()}")
+            results.append({
+                'name': test.name,
+                'status': status,
+                'description': test.description,
+                'tags': list(test.tags),
+                'success_criteria': test.success_criteria,
+                **extra
+            })
+        return results
+
+    async def _execute_test_with_agent(self, agent: Agent, test: TestCase) -> Dict[str, Any]:
         """
         Execute a single test with the given agent.
         """
-        test_name = test['name']
-        print(f"   🔍 Executing: {test_name}")
-        
+        test_name = test.name
+
+        # Deterministic runs can replay the cached outcome of an
+        # identical prompt instead of paying the agent round-trips
+        cache_key = None
+        if self._llm_temperature == 0:
+            cache_key = PromptCache.make_key(self._model_name, test.prompt, 0.0)
+            cached = await PROMPT_CACHE.get(cache_key)
+            if cached is not None:
+                logger.info(f"   ♻️  {test_name}: PASSED (cached)")
+                return cached
+
+        logger.info(f"   🔍 Executing: {test_name}")
+
         try:
             # Run the agent
             result = await agent.run()
-            
+
             # Collect test result
             test_result = {
                 'name': test_name,
                 'status': 'passed',
                 'result': result,
-                'description': test.get('description', ''),
-                'tags': test.get('tags', []),
-                'success_criteria': test.get('success_criteria', '')
+                'description': test.description,
+                'tags': list(test.tags),
+                'success_criteria': test.success_criteria
             }
-            
-            print(f"   ✅ {test_name}: PASSED")
+
+            if cache_key is not None:
+                # Store a JSON-safe copy; only passing results are
+                # cached so failures always re-run
+                await PROMPT_CACHE.set(cache_key, {**test_result, 'result': str(result)})
+
+            logger.info(f"   ✅ {test_name}: PASSED")
             return test_result
             
         except Exception as e:
@@ -223,12 +443,12 @@ class MRGBTestRunner:
                 'name': test_name,
                 'status': 'failed',
                 'error': str(e),
-                'description': test.get('description', ''),
-                'tags': test.get('tags', []),
-                'success_criteria': test.get('success_criteria', '')
+                'description': test.description,
+                'tags': list(test.tags),
+                'success_criteria': test.success_criteria
             }
             
-            print(f"   ❌ {test_name}: FAILED - {str(e)}")
+            logger.info(f"   ❌ {test_name}: FAILED - {str(e)}")
             return test_result
 
 
@@ -246,7 +466,9 @@ async def main():
     
     # Initialize and run tests
     runner = MRGBTestRunner()
-    
+    listener = _setup_logging()
+    listener.start()
+
     try:
         results = await runner.run_multi_tab_tests(str(test_suite_path))
         
@@ -255,29 +477,44 @@ async def main():
         print("📊 TEST EXECUTION SUMMARY")
         print("="*60)
         
-        passed = sum(1 for r in results if isinstance(r, dict) and r.get('status') == 'passed')
-        failed = sum(1 for r in results if isinstance(r, dict) and r.get('status') == 'failed')
-        errors = sum(1 for r in results if isinstance(r, Exception))
-        
+        # Partition in a single pass instead of three sums plus a reprint walk
+        passed = 0
+        failed_results = []
+        exception_results = []
+        for result in results:
+            if isinstance(result, Exception):
+                exception_results.append(result)
+            elif isinstance(result, dict) and result.get('status') == 'passed':
+                passed += 1
+            elif isinstance(result, dict) and result.get('status') == 'failed':
+                failed_results.append(result)
+
         print(f"Total Tests: {len(results)}")
         print(f"✅ Passed: {passed}")
-        print(f"❌ Failed: {failed}")
-        print(f"💥 Errors: {errors}")
-        
-        if failed > 0 or errors > 0:
+        print(f"❌ Failed: {len(failed_results)}")
+        print(f"💥 Errors: {len(exception_results)}")
+
+        cache_stats = PROMPT_CACHE.stats()
+        print(f"♻️  Prompt cache: {cache_stats['hits']} hits, "
+              f"{cache_stats['misses']} misses "
+              f"({cache_stats['hit_rate']:.0%} hit rate)")
+
+        if failed_results or exception_results:
             print("\n🔍 Failed Tests:")
-            for result in results:
-                if isinstance(result, dict) and result.get('status') == 'failed':
-                    print(f"   - {result['name']}: {result.get('error', 'Unknown error')}")
-                elif isinstance(result, Exception):
-                    print(f"   - Exception: {str(result)}")
+            for result in failed_results:
+                print(f"   - {result['name']}: {result.get('error', 'Unknown error')}")
+            for result in exception_results:
+                print(f"   - Exception: {str(result)}")
         
         print("\n🎉 Test execution completed!")
         
-    except Exception as e:
-        print(f"❌ Test execution failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        # logger.exception includes the traceback through the queue
+        # handler, so no inline traceback import on the failure path
+        logger.exception("❌ Test execution failed")
+    finally:
+        await stop_playwright()
+        listener.stop()
 
 
 if __name__ == "__main__":
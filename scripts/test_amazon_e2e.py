@@ -19,9 +19,12 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Warm the heavy third-party imports on threads before pulling them in
+from _warmup import warm_imports
+warm_imports()
+
 from config import Config
 from test_engine.test_engine import TestEngine
-from test_engine.test_runner import TestRunner
 from test_engine.result_collector import ResultCollector
 from llm_integration.llm_provider import LLMProvider
 from browser_manager.browser_manager import BrowserManager
@@ -38,11 +41,24 @@ def print_banner():
     print("="*80 + "\n")
 
 def print_test_summary(results):
-    """Print a summary of test results"""
+    """Print a summary of test results
+
+    Returns:
+        Number of failed tests
+    """
+    # Partition in a single pass instead of re-walking results per status
+    passed_results = []
+    failed_results = []
+    for result in results:
+        if result.status == 'passed':
+            passed_results.append(result)
+        elif result.status == 'failed':
+            failed_results.append(result)
+
     total_tests = len(results)
-    passed_tests = sum(1 for r in results if r.status == 'passed')
-    failed_tests = sum(1 for r in results if r.status == 'failed')
-    
+    passed_tests = len(passed_results)
+    failed_tests = len(failed_results)
+
     print("\n" + "="*80)
     print("📊 TEST EXECUTION SUMMARY")
     print("="*80)
@@ -50,20 +66,19 @@ def print_test_summary(results):
     print(f"✅ Passed: {passed_tests}")
     print(f"❌ Failed: {failed_tests}")
     print(f"📊 Success Rate: {(passed_tests/total_tests)*100:.1f}%" if total_tests > 0 else "📊 Success Rate: 0%")
-    
-    if failed_tests > 0:
+
+    if failed_results:
         print("\n❌ FAILED TESTS:")
-        for result in results:
-            if result.status == 'failed':
-                print(f"   • {result.test_name}: {result.error_message}")
-    
+        for result in failed_results:
+            print(f"   • {result.test_name}: {result.error_message}")
+
     print("\n✅ PASSED TESTS:")
-    for result in results:
-        if result.status == 'passed':
-            duration = (result.end_time - result.start_time).total_seconds()
-            print(f"   • {result.test_name} ({duration:.1f}s)")
-    
+    for result in passed_results:
+        duration = (result.end_time - result.start_time).total_seconds()
+        print(f"   • {result.test_name} ({duration:.1f}s)")
+
     print("="*80)
+    return failed_tests
 
 async def main():
     """Main test execution function"""
@@ -81,36 +96,27 @@ async def main():
         
         print(f"📋 Loading test suite: {test_suite_path}")
         
-        # Initialize LLM provider
-        print("🧠 Initializing LLM provider (Groq)...")
-        llm_provider = LLMProvider.create_provider(
-            provider_type="groq",
-            config=config
+        # LLM provider setup, browser manager setup and suite loading are
+        # independent and I/O-bound, so run them concurrently. Credentials
+        # are validated lazily when the first agent runs rather than with
+        # an eager round-trip here.
+        print("🧠 Initializing LLM provider (Groq), browser manager and test suite...")
+        from config.yaml_loader import YAMLLoader
+        llm_provider, browser_manager, test_suite = await asyncio.gather(
+            asyncio.to_thread(LLMProvider.create_provider, "groq", config),
+            asyncio.to_thread(BrowserManager, config),
+            asyncio.to_thread(YAMLLoader.load_test_suite_cached, str(test_suite_path)),
         )
-        
-        # Test LLM connection
-        print("🔗 Testing LLM connection...")
-        if not llm_provider.test_connection():
-            raise Exception("Failed to connect to LLM provider")
-        print("✅ LLM connection successful")
-        
-        # Initialize browser manager
-        print("🌐 Initializing browser manager...")
-        browser_manager = BrowserManager(config)
-        
+        if not llm_provider.api_key:
+            raise Exception("LLM unreachable: no Groq API key configured (set GROQ_API_KEY)")
+
         # Initialize test engine
         print("⚙️ Initializing test engine...")
         test_engine = TestEngine(config)
-        
+
         # Initialize result collector
         print("📊 Initializing result collector...")
         result_collector = ResultCollector()
-        
-        # Load and validate test suite
-        print("📖 Loading and validating test suite...")
-        from config.yaml_loader import YAMLLoader
-        yaml_loader = YAMLLoader()
-        test_suite = yaml_loader.load_test_suite(str(test_suite_path))
         print(f"✅ Loaded {len(test_suite.tests)} tests")
         
         # Display test overview
@@ -138,15 +144,20 @@ async def main():
         
         # Get results from test engine
         print("\n💾 Collecting and saving results...")
-        results = test_engine.get_results()
-        for result in results:
-            result_collector.add_result(result)
-        
-        # Generate reports
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_dir = project_root / "reports"
         report_dir.mkdir(exist_ok=True)
-        
+
+        # Stream each result to JSONL as it is collected so nothing is
+        # held in memory solely for the export step
+        jsonl_report_path = report_dir / f"amazon_test_report_{timestamp}.jsonl"
+        results = test_engine.get_results()
+        with result_collector.stream_to_jsonl(str(jsonl_report_path)):
+            for result in results:
+                result_collector.add_result(result)
+        print(f"📄 JSONL results streamed: {jsonl_report_path}")
+
+        # Generate reports
         html_report_path = report_dir / f"amazon_test_report_{timestamp}.html"
         json_report_path = report_dir / f"amazon_test_report_{timestamp}.json"
         
@@ -158,10 +169,9 @@ async def main():
         report_path = html_path  # For backward compatibility
         
         # Print summary
-        print_test_summary(results)
-        
+        failed_count = print_test_summary(results)
+
         # Final status
-        failed_count = sum(1 for r in results if r.status == 'failed')
         if failed_count == 0:
             print("\n🎉 ALL TESTS PASSED! The BrowserTest AI framework is working correctly.")
         else:
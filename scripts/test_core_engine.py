@@ -53,9 +53,10 @@ async def test_engine_basic_functionality():
         config = Config()
         print("   ✓ Configuration initialized")
         
-        # Create test engine
+        # Create test engine; this only validates structure, so skip
+        # browser manager setup entirely
         print("\n2. Creating test engine...")
-        test_engine = TestEngine(config)
+        test_engine = TestEngine(config, lazy_browser=True)
         print("   ✓ Test engine created")
         
         # Get LLM info
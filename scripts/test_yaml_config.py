@@ -5,15 +5,13 @@ import sys
 import os
 from pathlib import Path
 
-# Add the project root to Python path
+# Add the project root to Python path (no-op for installed checkouts)
 project_root = Path(__file__).parent.parent  # Go up one level from scripts to project root
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
-# Direct imports to avoid package initialization issues
-sys.path.insert(0, str(project_root / "config"))
-
-from yaml_loader import YAMLLoader
-from yaml_schema import YAMLSchemaValidator
+from config.yaml_loader import YAMLLoader
+from config.yaml_schema import YAMLSchemaValidator
 
 def test_yaml_configuration():
     """Test the YAML configuration system"""
@@ -24,18 +22,14 @@ def test_yaml_configuration():
     print("\n1. Creating sample YAML configurations...")
     
     try:
-        # Create basic sample
-        YAMLLoader.create_sample_config(str(project_root / "sample_basic.yaml"), "basic")
-        print("   ✓ Basic sample created: sample_basic.yaml")
-        
-        # Create advanced sample
-        YAMLLoader.create_sample_config(str(project_root / "sample_advanced.yaml"), "advanced")
-        print("   ✓ Advanced sample created: sample_advanced.yaml")
-        
-        # Create comprehensive sample
-        YAMLLoader.create_sample_config(str(project_root / "sample_comprehensive.yaml"), "comprehensive")
-        print("   ✓ Comprehensive sample created: sample_comprehensive.yaml")
-        
+        # Render the template once and write all samples concurrently
+        sample_names = ["sample_basic.yaml", "sample_advanced.yaml", "sample_comprehensive.yaml"]
+        YAMLLoader.create_sample_configs_bulk(
+            [str(project_root / name) for name in sample_names]
+        )
+        for name in sample_names:
+            print(f"   ✓ Sample created: {name}")
+
     except Exception as e:
         print(f"   ✗ Error creating samples: {e}")
         return False
@@ -1,6 +1,14 @@
 """Test result collection and management"""
 
 import json
+from contextlib import contextmanager
+
+# orjson serializes several times faster than the stdlib; fall back
+# quietly when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from dataclasses import dataclass, asdict
@@ -53,14 +61,40 @@ class ResultCollector:
     def __init__(self):
         self._results: List[TestResult] = []
         self._test_suite_info: Dict[str, Any] = {}
-    
+        self._jsonl_stream = None
+
     def add_result(self, result: TestResult):
         """Add a test result
-        
+
         Args:
             result: Test result to add
         """
         self._results.append(result)
+        if self._jsonl_stream is not None:
+            self._jsonl_stream.write(json.dumps(result.to_dict(), ensure_ascii=False) + '\n')
+            self._jsonl_stream.flush()
+
+    @contextmanager
+    def stream_to_jsonl(self, file_path: str):
+        """Stream each added result to a JSONL file as it arrives
+
+        Every add_result call inside the block appends one JSON line and
+        flushes, so results are on disk immediately instead of held until
+        a final export pass.
+
+        Args:
+            file_path: Output file path
+
+        Yields:
+            This collector
+        """
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8') as stream:
+            self._jsonl_stream = stream
+            try:
+                yield self
+            finally:
+                self._jsonl_stream = None
     
     def set_test_suite_info(self, test_suite_name: str, test_suite_description: str = None, 
                            base_url: str = None, total_tests: int = None):
@@ -199,9 +233,13 @@ class ResultCollector:
         Path(file_path).parent.mkdir(parents=True, exist_ok=True)
         
         # Write to file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
-        
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=2, ensure_ascii=False)
+
         return file_path
     
     def export_to_html(self, file_path: str) -> str:
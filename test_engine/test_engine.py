@@ -16,19 +16,30 @@ from .result_collector import ResultCollector, TestResult
 class TestEngine:
     """Main test execution engine with LLM integration"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, lazy_browser: bool = False):
         """Initialize test engine
-        
+
         Args:
             config: Application configuration
+            lazy_browser: Defer browser manager construction until first
+                use; structure-only checks never pay for browser setup
         """
         self.config = config
-        
+
         # Get LLM provider type from config
         provider_type = config.get("llm.provider", "google")
         self.llm_provider = LLMProvider.create_provider(provider_type, config)
-        self.browser_manager = BrowserManager(config)
+        self._browser_manager: Optional[BrowserManager] = None
+        if not lazy_browser:
+            self._browser_manager = BrowserManager(config)
         self.result_collector = ResultCollector()
+
+    @property
+    def browser_manager(self) -> BrowserManager:
+        """The browser manager, built on first access when deferred"""
+        if self._browser_manager is None:
+            self._browser_manager = BrowserManager(self.config)
+        return self._browser_manager
     
     async def execute_test_suite(self, test_suite: TestSuite) -> Dict[str, Any]:
         """Execute a complete test suite
@@ -211,7 +222,9 @@ class TestEngine:
     
     async def cleanup(self):
         """Cleanup resources"""
-        await self.browser_manager.cleanup()
+        # No-op when the browser manager was never built
+        if self._browser_manager is not None:
+            await self._browser_manager.cleanup()
     
     def get_llm_info(self) -> Dict[str, Any]:
         """Get LLM provider information
@@ -33,6 +33,8 @@ class TestRunner:
         self.llm_provider = llm_provider
         self.browser_manager = browser_manager
         self.browser_use_integration = BrowserUseIntegration(config, llm_provider)
+        # Normalize the base URL once so per-test resolution is a single concat
+        self._base_url = (config.get("base_url", "") or "").rstrip('/')
     
     async def run_test(self, test_case: TestCase) -> TestResult:
         """Run a single test case
@@ -268,11 +270,10 @@ class TestRunner:
         # Return absolute URLs as-is
         if url.startswith(('http://', 'https://')):
             return url
-        
-        # Use base URL from config for relative URLs
-        base_url = self.config.get("base_url", "")
-        if base_url:
-            return f"{base_url.rstrip('/')}/{url.lstrip('/')}"
+
+        # Use the pre-normalized base URL for relative URLs
+        if self._base_url:
+            return f"{self._base_url}/{url.lstrip('/')}"
         return url
     
 